@@ -2,43 +2,92 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import ATTR_LAST_GOOD_UPDATE, ATTR_STALE, DOMAIN
 
-from .torch_api import TorchApi
+from .hub import async_get_hub
 from .coordinator import TorchPelletSystemDataUpdateCoordinator
+from .long_term_statistics import async_remove_statistics_state
+from .services import async_setup_services
+
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR, Platform.SWITCH]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Torch Pellet System services."""
+
+    async_setup_services(hass)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH]
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Torch Pellet System from a config entry."""
 
-    api = await hass.async_add_executor_job(
-        TorchApi, entry.data["username"], entry.data["password"]
-    )
+    hub = async_get_hub(hass)
+    api = await hub.async_get_api(entry)
 
     coordinator = TorchPelletSystemDataUpdateCoordinator(hass, api, entry)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator.poll_offset = hub.async_poll_offset(
+        entry, coordinator.polling_policy.interval
+    )
+
+    try:
+        await coordinator.long_term_statistics.async_load()
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await hub.async_release_api(entry)
+        raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    async def async_shutdown(event: Event) -> None:
+        """Write the buffered telemetry when Home Assistant stops."""
+
+        await coordinator.async_shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_shutdown)
+    )
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator."""
+
+    hass.data[DOMAIN][entry.entry_id].async_apply_options(entry.options)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        await async_get_hub(hass).async_release_api(entry)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted state of a removed config entry."""
+
+    await async_remove_statistics_state(hass, entry.entry_id)
+
+
 class TorchPelletSystemEntity(
     CoordinatorEntity[TorchPelletSystemDataUpdateCoordinator]
 ):
@@ -46,8 +95,28 @@ class TorchPelletSystemEntity(
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: TorchPelletSystemDataUpdateCoordinator) -> None:
-        """Initialize a Torch Pellet System entity."""
+    def __init__(
+        self,
+        coordinator: TorchPelletSystemDataUpdateCoordinator,
+        data_key: str | None = None,
+    ) -> None:
+        """Initialize a Torch Pellet System entity.
+
+        The data key is the variable the entity shows. The entity is only
+        updated when the value of that variable changes.
+        """
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, data_key)
         self._server_unique_id = coordinator.config_entry.entry_id
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark the state as stale while the last good readings are served."""
+
+        if not (data := self.coordinator.data) or not data.stale:
+            return None
+
+        return {
+            ATTR_STALE: True,
+            ATTR_LAST_GOOD_UPDATE: dt_util.as_local(data.timestamp).isoformat(),
+        }
@@ -0,0 +1,139 @@
+"""Detection of faults of the pellet burner in the polled readings."""
+from __future__ import annotations
+
+from collections import deque
+
+from .const import (
+    BURNER_OVERHEATING_KEY,
+    BURNER_TEMPERATURE_RATE_LIMIT,
+    FAILED_IGNITION_KEY,
+    FLAMEOUT_KEY,
+    FLAMEOUT_LIGHT_RATIO,
+    IGNITION_TIMEOUT,
+    LINK_FLAP_COUNT,
+    LINK_FLAP_WINDOW,
+    LINK_FLAPPING_KEY,
+)
+from .models import PelletSystemState, TorchPelletSystemSnapshot
+
+
+class TorchAnomalyDetector:
+    """Incremental checks of the pellet burner, run once per poll.
+
+    Every check keeps a fixed amount of state, so the detection costs the
+    same whatever the uptime and never needs the history of the recorder.
+    - A failed ignition is a burner starting for longer than the timeout.
+    - A flameout is a burning burner whose flame got much darker than the
+      brightest flame of the same burn.
+    - Overheating is a burner temperature rising faster than the limit.
+    - A flapping link changed its status too often within the window.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector without any readings."""
+
+        self._previous: TorchPelletSystemSnapshot | None = None
+        # Time and value of the last raw burner temperature reading
+        self._burner_temperature: tuple[float, float] | None = None
+        self._starting_since: float | None = None
+        self._brightest_flame = 0.0
+        self._link_changes: deque[float] = deque(maxlen=LINK_FLAP_COUNT)
+        self.active: dict[str, bool] = {
+            FAILED_IGNITION_KEY: False,
+            FLAMEOUT_KEY: False,
+            BURNER_OVERHEATING_KEY: False,
+            LINK_FLAPPING_KEY: False,
+        }
+
+    def update(
+        self, snapshot: TorchPelletSystemSnapshot, burner_temperature: float | None
+    ) -> set[str]:
+        """Take in a new snapshot and return the anomalies that changed.
+
+        The burner temperature is the raw reading polled with the snapshot,
+        because the published one only moves once it leaves the deadband. It
+        is None when the poll did not read it, such as the burner state
+        refresh confirming a command, and the next reading is then compared
+        with the last one read.
+        """
+
+        previous, self._previous = self._previous, snapshot
+        now = snapshot.timestamp.timestamp()
+
+        active = {
+            FAILED_IGNITION_KEY: self._check_ignition(snapshot, now),
+            FLAMEOUT_KEY: self._check_flame(snapshot),
+            BURNER_OVERHEATING_KEY: self._check_burner_temperature(
+                burner_temperature, now
+            ),
+            LINK_FLAPPING_KEY: self._check_link(previous, snapshot, now),
+        }
+
+        changed_keys = {
+            key for key, value in active.items() if value != self.active[key]
+        }
+        self.active = active
+
+        return changed_keys
+
+    def _check_ignition(self, snapshot: TorchPelletSystemSnapshot, now: float) -> bool:
+        """Return whether the burner has been starting for too long."""
+
+        if snapshot.pellet_system_state is not PelletSystemState.STARTING:
+            self._starting_since = None
+            return False
+
+        if self._starting_since is None:
+            self._starting_since = now
+
+        return now - self._starting_since > IGNITION_TIMEOUT
+
+    def _check_flame(self, snapshot: TorchPelletSystemSnapshot) -> bool:
+        """Return whether the flame went out while the burner is burning."""
+
+        if snapshot.pellet_system_state is not PelletSystemState.BURNING:
+            self._brightest_flame = 0.0
+            return False
+
+        if (flame_light := snapshot.flame_light) is None:
+            return self.active[FLAMEOUT_KEY]
+
+        self._brightest_flame = max(self._brightest_flame, flame_light)
+
+        return flame_light < self._brightest_flame * FLAMEOUT_LIGHT_RATIO
+
+    def _check_burner_temperature(
+        self, burner_temperature: float | None, now: float
+    ) -> bool:
+        """Return whether the burner temperature rises too fast."""
+
+        if burner_temperature is None:
+            return self.active[BURNER_OVERHEATING_KEY]
+
+        previous, self._burner_temperature = (
+            self._burner_temperature,
+            (now, burner_temperature),
+        )
+
+        if previous is None or (duration := now - previous[0]) <= 0:
+            return self.active[BURNER_OVERHEATING_KEY]
+
+        rise = burner_temperature - previous[1]
+
+        return rise * 60 / duration > BURNER_TEMPERATURE_RATE_LIMIT
+
+    def _check_link(
+        self,
+        previous: TorchPelletSystemSnapshot | None,
+        snapshot: TorchPelletSystemSnapshot,
+        now: float,
+    ) -> bool:
+        """Return whether the link status changed too often lately."""
+
+        if previous is not None and snapshot.tnc_status is not previous.tnc_status:
+            self._link_changes.append(now)
+
+        return (
+            len(self._link_changes) == LINK_FLAP_COUNT
+            and now - self._link_changes[0] <= LINK_FLAP_WINDOW
+        )
@@ -0,0 +1,80 @@
+"""Support for the faults detected in the Torch Pellet System readings."""
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_platform
+
+from . import TorchPelletSystemEntity
+from .const import (
+    BURNER_OVERHEATING_KEY,
+    DOMAIN,
+    FAILED_IGNITION_KEY,
+    FLAMEOUT_KEY,
+    LINK_FLAPPING_KEY,
+)
+from .coordinator import TorchPelletSystemDataUpdateCoordinator
+
+ANOMALY_BINARY_SENSOR_TYPES: tuple[BinarySensorEntityDescription, ...] = (
+    BinarySensorEntityDescription(
+        key=FAILED_IGNITION_KEY,
+        name="Failed Ignition",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    BinarySensorEntityDescription(
+        key=FLAMEOUT_KEY,
+        name="Flameout",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    BinarySensorEntityDescription(
+        key=BURNER_OVERHEATING_KEY,
+        name="Burner Overheating",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+    BinarySensorEntityDescription(
+        key=LINK_FLAPPING_KEY,
+        name="Torch Net Control Link Flapping",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: entity_platform.AddEntitiesCallback,
+) -> None:
+    """Set up the Torch Pellet System anomaly binary sensors."""
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        TorchPelletSystemAnomalyBinarySensor(coordinator, description)
+        for description in ANOMALY_BINARY_SENSOR_TYPES
+    )
+
+
+class TorchPelletSystemAnomalyBinarySensor(TorchPelletSystemEntity, BinarySensorEntity):
+    """Representation of a fault detected in the Torch Pellet System readings."""
+
+    def __init__(
+        self,
+        coordinator: TorchPelletSystemDataUpdateCoordinator,
+        description: BinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
+
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the fault is currently detected."""
+
+        return self.coordinator.anomalies.active[self.entity_description.key]
@@ -1,19 +1,40 @@
 """Config flow for Torch Pellet System integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
 from typing import Any
 
 import voluptuous as vol
 
-from .torch_api import TorchApi
-
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
+from .const import (
+    CONF_DATA_CACHE_TTL,
+    CONF_EXPORT_MAX_SIZE,
+    CONF_EXPORT_TELEMETRY,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_STALE_AGE,
+    CONF_TEMPERATURE_DEADBAND,
+    DEFAULT_DATA_CACHE_TTL,
+    DEFAULT_EXPORT_MAX_SIZE,
+    DEFAULT_EXPORT_TELEMETRY,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_STALE_AGE,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
+from .hub import async_get_hub
+from .torch_api import TorchApiError, TorchAuthenticationError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,52 +45,31 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
-
-class PlaceholderHub:
-    """Placeholder class to make tests pass.
-
-    TODO Remove this placeholder class and replace with things from your PyPI package.
-    """
-
-    def __init__(self) -> None:
-        """Initialize."""
-
-    async def authenticate(self, username: str, password: str) -> bool:
-        """Test if we can authenticate with the host."""
-        return True
+STEP_REAUTH_DATA_SCHEMA = vol.Schema({vol.Required("password"): str})
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    The credentials are checked with a single login, whose session is kept
+    for setting up the entry.
     """
 
-    torch_api_client = await hass.async_add_executor_job(
-        TorchApi, data["username"], data["password"]
-    )
-
-    # Validate Credentials
-    authentication_result = await hass.async_add_executor_job(
-        torch_api_client.login, data["username"], data["password"]
-    )
-
-    if (
-        authentication_result
-        == torch_api_client.TORCH_AUTHENTICATION_RESULT["InvalidCredentials"]
-    ):
-        raise InvalidAuth
-    elif (
-        authentication_result
-        == torch_api_client.TORCH_AUTHENTICATION_RESULT["ServiceUnavailable"]
-    ):
-        raise CannotConnect
-    else:
-        return {
-            "title": "Torch Pellet System",
-            "username": data["username"],
-            "password": data["password"],
-        }
+    try:
+        await async_get_hub(hass).async_validate_credentials(
+            data["username"], data["password"]
+        )
+    except TorchAuthenticationError as error:
+        raise InvalidAuth from error
+    except TorchApiError as error:
+        raise CannotConnect from error
+
+    return {
+        "title": "Torch Pellet System",
+        "username": data["username"],
+        "password": data["password"],
+    }
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -77,6 +77,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    _entry: config_entries.ConfigEntry
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -104,6 +114,162 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
+        """Handle the Torch Web Interface rejecting the credentials."""
+        self._entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for the new password of the account."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            errors = await self._async_update_credentials(
+                self._entry.data["username"], user_input["password"]
+            )
+            if not errors:
+                return self.async_abort(reason="reauth_successful")
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
+            description_placeholders={"username": self._entry.data["username"]},
+            errors=errors,
+        )
+
+    async def async_step_reconfigure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Change the credentials of an entry."""
+        self._entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            errors = await self._async_update_credentials(
+                user_input["username"], user_input["password"]
+            )
+            if not errors:
+                return self.async_abort(reason="reconfigure_successful")
+
+        return self.async_show_form(
+            step_id="reconfigure",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_USER_DATA_SCHEMA,
+                {"username": self._entry.data["username"]},
+            ),
+            errors=errors,
+        )
+
+    async def _async_update_credentials(
+        self, username: str, password: str
+    ) -> dict[str, str]:
+        """Check new credentials and hand them to the running entries.
+
+        The running API client takes over the credentials and the session
+        of the check, and the coordinators resume polling, so the entries are
+        not reloaded. An entry without a running client is reloaded instead.
+        """
+        try:
+            entry_ids = await async_get_hub(self.hass).async_update_credentials(
+                self._entry, username, password
+            )
+        except TorchAuthenticationError:
+            return {"base": "invalid_auth"}
+        except TorchApiError:
+            return {"base": "cannot_connect"}
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected exception")
+            return {"base": "unknown"}
+
+        for entry_id in entry_ids or {self._entry.entry_id}:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            self.hass.config_entries.async_update_entry(
+                entry, data={**entry.data, "username": username, "password": password}
+            )
+
+            if entry_ids is None:
+                self.hass.async_create_task(
+                    self.hass.config_entries.async_reload(entry_id)
+                )
+            elif coordinator := self.hass.data[DOMAIN].get(entry_id):
+                await coordinator.async_request_refresh()
+
+        return {}
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the options of a Torch Pellet System entry."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling, reporting and caching options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        interval = vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_FAST_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL
+                        ),
+                    ): interval,
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL,
+                        default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): interval,
+                    vol.Optional(
+                        CONF_IDLE_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+                        ),
+                    ): interval,
+                    vol.Optional(
+                        CONF_TEMPERATURE_DEADBAND,
+                        default=options.get(
+                            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                    vol.Optional(
+                        CONF_DATA_CACHE_TTL,
+                        default=options.get(
+                            CONF_DATA_CACHE_TTL, DEFAULT_DATA_CACHE_TTL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=30)),
+                    vol.Optional(
+                        CONF_MAX_STALE_AGE,
+                        default=options.get(CONF_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Optional(
+                        CONF_EXPORT_TELEMETRY,
+                        default=options.get(
+                            CONF_EXPORT_TELEMETRY, DEFAULT_EXPORT_TELEMETRY
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_EXPORT_MAX_SIZE,
+                        default=options.get(
+                            CONF_EXPORT_MAX_SIZE, DEFAULT_EXPORT_MAX_SIZE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10240)),
+                }
+            ),
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -3,6 +3,11 @@
 import logging
 
 DOMAIN = "torch_pellet_system"
+DATA_HUB = f"{DOMAIN}_hub"
+
+STORAGE_KEY = f"{DOMAIN}.sessions"
+STATISTICS_STORAGE_KEY = f"{DOMAIN}.statistics"
+STORAGE_VERSION = 1
 LOGGER = logging.getLogger(__package__)
 
 PELLET_SYSTEM_STATE_KEY = "bd_state"
@@ -14,3 +19,101 @@ LIGTH_SENSOR_KEY = "bd_lux"
 BURNER_CURRENT_WORKING_POWER_KEY = "bd_power"
 PELLET_SYSTEM_TNC_STATUS_KEY = "link_status"
 BURNED_PELLETS_QUANTITY = "bd_pell"
+
+PELLET_CONSUMPTION_RATE_KEY = "pellet_consumption_rate"
+BURN_DUTY_CYCLE_KEY = "burn_duty_cycle"
+TEMPERATURE_DELTA_KEY = "temperature_delta"
+THERMAL_EFFICIENCY_KEY = "thermal_efficiency"
+
+FAILED_IGNITION_KEY = "failed_ignition"
+FLAMEOUT_KEY = "flameout"
+BURNER_OVERHEATING_KEY = "burner_overheating"
+LINK_FLAPPING_KEY = "link_flapping"
+
+REQUEST_LATENCY_KEY = "request_latency"
+REQUEST_ERRORS_KEY = "request_errors"
+PAYLOAD_SIZE_KEY = "payload_size"
+LOGINS_KEY = "logins"
+CONNECTIONS_CREATED_KEY = "connections_created"
+
+GET_DATA_ENDPOINT = "/user/ajax/get_data"
+
+# Event fired when an anomaly is detected or cleared
+EVENT_ANOMALY = f"{DOMAIN}_anomaly"
+
+# Coordinator context of the entities showing the request metrics
+METRICS_CONTEXT = "metrics"
+
+# The variables of the get_data payload that have dedicated sensors
+SENSOR_DATA_KEYS = frozenset(
+    (
+        PELLET_SYSTEM_STATE_KEY,
+        WATER_TEMPERATURE_SETTING_KEY,
+        WATER_TEMPERATURE_OUT_OF_THE_PELLET_SYSTEM_KEY,
+        WATER_TEMPERATURE_COMING_IN_THE_PELLET_SYSTEM_KEY,
+        PELLET_BURNER_TEMPERATURE_KEY,
+        LIGTH_SENSOR_KEY,
+        BURNER_CURRENT_WORKING_POWER_KEY,
+        PELLET_SYSTEM_TNC_STATUS_KEY,
+        BURNED_PELLETS_QUANTITY,
+    )
+)
+
+CONF_FAST_SCAN_INTERVAL = "fast_scan_interval"
+CONF_IDLE_SCAN_INTERVAL = "idle_scan_interval"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_DATA_CACHE_TTL = "data_cache_ttl"
+CONF_MAX_STALE_AGE = "max_stale_age"
+CONF_EXPORT_TELEMETRY = "export_telemetry"
+CONF_EXPORT_MAX_SIZE = "export_max_size"
+
+# Range of the polling intervals the options accept, in seconds
+MIN_SCAN_INTERVAL = 5
+MAX_SCAN_INTERVAL = 3600
+
+DEFAULT_FAST_SCAN_INTERVAL = 15
+DEFAULT_SCAN_INTERVAL = 60
+DEFAULT_IDLE_SCAN_INTERVAL = 600
+DEFAULT_TEMPERATURE_DEADBAND = 0.0
+DEFAULT_DATA_CACHE_TTL = 5
+DEFAULT_MAX_STALE_AGE = 900
+DEFAULT_EXPORT_TELEMETRY = False
+DEFAULT_EXPORT_MAX_SIZE = 100
+
+ATTR_STALE = "stale"
+ATTR_LAST_GOOD_UPDATE = "last_good_update"
+
+# Temperatures whose jitter within the deadband is not reported
+DEADBAND_TEMPERATURE_KEYS = (
+    WATER_TEMPERATURE_OUT_OF_THE_PELLET_SYSTEM_KEY,
+    WATER_TEMPERATURE_COMING_IN_THE_PELLET_SYSTEM_KEY,
+    PELLET_BURNER_TEMPERATURE_KEY,
+)
+
+# Number of fast polls following a switch command
+FAST_POLLING_BURST = 8
+
+# Rolling window of the derived statistics, in seconds
+STATISTICS_WINDOW = 3600
+# Poll intervals kept for the derived statistics: a window of the fastest
+# polling, doubled for the burner command refreshes in between
+STATISTICS_BUFFER_SIZE = 2 * STATISTICS_WINDOW // MIN_SCAN_INTERVAL
+# Lower heating value of wood pellets, in kWh/kg
+PELLET_ENERGY_DENSITY = 4.8
+
+# Polls written to the telemetry export at once
+EXPORT_BATCH_SIZE = 60
+# Longest time a poll waits in memory before it is exported, in seconds
+EXPORT_FLUSH_INTERVAL = 900
+# Rotated telemetry export files kept besides the current one
+EXPORT_BACKUP_COUNT = 4
+
+# Time the burner may spend starting before the ignition is considered failed
+IGNITION_TIMEOUT = 15 * 60
+# Share of the brightest flame of a burn below which the flame went out
+FLAMEOUT_LIGHT_RATIO = 0.3
+# Fastest normal rise of the burner temperature, in °C per minute
+BURNER_TEMPERATURE_RATE_LIMIT = 10.0
+# Link status changes within the window that make the link flapping
+LINK_FLAP_COUNT = 4
+LINK_FLAP_WINDOW = 30 * 60
@@ -1,45 +1,570 @@
 """Data update coordinator for the Torch Pellet System integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+import dataclasses
 from datetime import timedelta
-import socket
-from ssl import SSLError
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import LOGGER
+from .const import (
+    CONF_DATA_CACHE_TTL,
+    CONF_EXPORT_MAX_SIZE,
+    CONF_EXPORT_TELEMETRY,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_STALE_AGE,
+    CONF_TEMPERATURE_DEADBAND,
+    DEADBAND_TEMPERATURE_KEYS,
+    DEFAULT_DATA_CACHE_TTL,
+    DEFAULT_EXPORT_MAX_SIZE,
+    DEFAULT_EXPORT_TELEMETRY,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_STALE_AGE,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DOMAIN,
+    EVENT_ANOMALY,
+    FAST_POLLING_BURST,
+    LOGGER,
+    METRICS_CONTEXT,
+    PELLET_BURNER_TEMPERATURE_KEY,
+    PELLET_SYSTEM_STATE_KEY,
+    SENSOR_DATA_KEYS,
+)
+from .anomalies import TorchAnomalyDetector
+from .derived import TorchDerivedStatistics
+from .exporter import TorchTelemetryExporter
+from .long_term_statistics import TorchLongTermStatistics
+from .models import (
+    PelletSystemState,
+    TorchNetControlStatus,
+    TorchPelletSystemSnapshot,
+    is_numeric,
+    to_float,
+)
 
-from .torch_api import TorchApi
+from .update_source import (
+    TorchConditionalSource,
+    TorchPollingSource,
+    TorchUpdateSource,
+)
+from .torch_api import (
+    AsyncTorchApi,
+    TorchApiError,
+    TorchAuthenticationError,
+)
 
 
-class TorchPelletSystemDataUpdateCoordinator(DataUpdateCoordinator):
+BURNER_STATE_DATA_KEYS = frozenset((PELLET_SYSTEM_STATE_KEY,))
+
+_TRANSITIONAL_STATES = (PelletSystemState.STARTING, PelletSystemState.COOLING_DOWN)
+
+
+class TorchPollingPolicy:
+    """Choose the polling interval from the state of the pellet burner."""
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        """Initialize the policy from the config entry options."""
+
+        self.fast_interval = timedelta(
+            seconds=options.get(CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL)
+        )
+        self.interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.idle_interval = timedelta(
+            seconds=options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL)
+        )
+        # Age up to which the last good snapshot is served when polls fail
+        self.max_stale_age = timedelta(
+            seconds=options.get(CONF_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE)
+        )
+
+    def interval_for(self, snapshot: TorchPelletSystemSnapshot) -> timedelta:
+        """Return the interval until the next poll after receiving a snapshot.
+
+        Ignition and cooling down change the readings quickly and are polled
+        fast. A turned off burner, or one that lost its link to the cloud, is
+        polled slowly.
+        """
+
+        if snapshot.tnc_status is TorchNetControlStatus.OFFLINE:
+            return self.idle_interval
+
+        if snapshot.pellet_system_state in _TRANSITIONAL_STATES:
+            return self.fast_interval
+
+        if snapshot.pellet_system_state is PelletSystemState.TURNED_OFF:
+            return self.idle_interval
+
+        return self.interval
+
+
+class TorchChangeFilter:
+    """Keep the values published to entities and detect which ones changed."""
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        """Initialize the filter from the config entry options."""
+
+        self.values: dict[str, str] = {}
+        self.apply_options(options)
+
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Set the deadbands from the config entry options."""
+
+        temperature_deadband = options.get(
+            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+        )
+
+        self.deadbands: dict[str, float] = {
+            key: temperature_deadband
+            for key in DEADBAND_TEMPERATURE_KEYS
+            if temperature_deadband
+        }
+
+    def update(self, data: Mapping[str, str]) -> set[str]:
+        """Take in new data and return the keys whose published value changed.
+
+        A value that moved less than the deadband of its key keeps the
+        previously published value, so jitter is never reported.
+        """
+
+        changed_keys = set()
+
+        for key, value in data.items():
+            published_value = self.values.get(key)
+
+            if value == published_value:
+                continue
+
+            if (
+                published_value is not None
+                and (deadband := self.deadbands.get(key))
+                and _within_deadband(published_value, value, deadband)
+            ):
+                continue
+
+            self.values[key] = value
+            changed_keys.add(key)
+
+        return changed_keys
+
+
+def _within_deadband(published_value: str, value: str, deadband: float) -> bool:
+    """Return whether a numeric value moved less than the deadband.
+
+    Values that are not numbers, such as a missing reading, never are.
+    """
+
+    if (number := to_float(value)) is None or (
+        published_number := to_float(published_value)
+    ) is None:
+        return False
+
+    return abs(number - published_number) < deadband
+
+
+class TorchBurnerCommandPipeline:
+    """Send burner on and off commands, coalescing rapid toggles.
+
+    Commands wait for a short moment before they are sent, and only the last
+    requested state is sent. Every command is confirmed with an immediate
+    refresh of the burner state.
+    """
+
+    COALESCE_DELAY = 1.0
+
+    def __init__(self, coordinator: TorchPelletSystemDataUpdateCoordinator) -> None:
+        """Initialize the command pipeline."""
+
+        self._coordinator = coordinator
+        self._requested_on: bool | None = None
+        self._commands: asyncio.Task[bool] | None = None
+
+    async def async_set_burner_on(self, turn_on: bool) -> bool:
+        """Request the burner to be switched on or off.
+
+        Returns whether the burner confirmed the last requested state. All
+        callers whose requests were coalesced receive the same result.
+        """
+
+        self._requested_on = turn_on
+
+        if self._commands is None:
+            self._commands = self._coordinator.hass.async_create_task(
+                self._async_send_commands()
+            )
+
+        return await asyncio.shield(self._commands)
+
+    async def _async_send_commands(self) -> bool:
+        """Send the requested state until it no longer changes."""
+
+        try:
+            await asyncio.sleep(self.COALESCE_DELAY)
+
+            sent_on = None
+            confirmed = True
+
+            while self._requested_on != sent_on:
+                sent_on = self._requested_on
+                confirmed = await self._async_send_command(sent_on)
+
+            return confirmed
+        finally:
+            self._commands = None
+
+    async def _async_send_command(self, turn_on: bool) -> bool:
+        """Send one command and confirm it against the burner state."""
+
+        coordinator = self._coordinator
+
+        if coordinator.data and coordinator.data.is_burner_on == turn_on:
+            return True
+
+        api = coordinator.api
+        status = await (api.turn_burner_on() if turn_on else api.turn_burner_off())
+
+        if status != 200:
+            LOGGER.warning("Torch rejected the burner command with status %s", status)
+            return False
+
+        snapshot = await coordinator.async_refresh_burner_state()
+
+        if snapshot.is_burner_on != turn_on:
+            LOGGER.warning(
+                "The pellet burner did not turn %s, its state is %s",
+                "on" if turn_on else "off",
+                snapshot.pellet_system_state,
+            )
+            return False
+
+        return True
+
+
+class TorchPelletSystemDataUpdateCoordinator(
+    DataUpdateCoordinator[TorchPelletSystemSnapshot]
+):
     """Data update coordinator for the Torch Pellet System integration."""
 
     config_entry: ConfigEntry
 
-    def __init__(self, hass: HomeAssistant, api: TorchApi, entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, api: AsyncTorchApi, entry: ConfigEntry
+    ) -> None:
         """Initialize the coordinator."""
+        self.polling_policy = TorchPollingPolicy(entry.options)
+
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=entry.title,
-            update_interval=timedelta(seconds=60),
+            update_interval=self.polling_policy.interval,
         )
         self.api = api
+        self.api.data_cache_ttl = entry.options.get(
+            CONF_DATA_CACHE_TTL, DEFAULT_DATA_CACHE_TTL
+        )
         self.config_entry = entry
+        self._fast_polls_remaining = 0
+        self._change_filter = TorchChangeFilter(entry.options)
+        self._changed_keys: set[str] = {METRICS_CONTEXT}
+        self._listeners_saw_success: bool | None = None
+        self._listeners_saw_stale = False
+        self.burner_commands = TorchBurnerCommandPipeline(self)
+        self.statistics = TorchDerivedStatistics()
+        self.long_term_statistics = TorchLongTermStatistics(hass, entry)
+        self.anomalies = TorchAnomalyDetector()
+        # Variables the pellet system reports, learnt on the first update.
+        # The numeric ones without a dedicated sensor are decoded into the
+        # readings of every snapshot.
+        self.variable_keys: frozenset[str] = frozenset()
+        self.reading_keys: frozenset[str] | None = None
+        self.update_source: TorchUpdateSource = TorchConditionalSource(api)
+        # Delay added once to the next poll to stagger entries sharing a hub
+        self.poll_offset = timedelta()
+        self.exporter: TorchTelemetryExporter | None = None
+        self._async_apply_export_options(entry.options)
+        # Live state set aside while recorded polls are replayed
+        self._live_state: tuple[
+            TorchUpdateSource,
+            TorchPelletSystemSnapshot | None,
+            TorchChangeFilter,
+            TorchDerivedStatistics,
+            TorchAnomalyDetector,
+        ] | None = None
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed config entry options to the running coordinator."""
+
+        self.polling_policy = TorchPollingPolicy(options)
+        self._change_filter.apply_options(options)
+        self.api.data_cache_ttl = options.get(
+            CONF_DATA_CACHE_TTL, DEFAULT_DATA_CACHE_TTL
+        )
+        self._async_apply_export_options(options)
+
+        if self.data:
+            self.update_interval = self.polling_policy.interval_for(self.data)
+
+    @callback
+    def _async_apply_export_options(self, options: Mapping[str, Any]) -> None:
+        """Start, resize or stop the telemetry export."""
+
+        max_size = options.get(CONF_EXPORT_MAX_SIZE, DEFAULT_EXPORT_MAX_SIZE) << 20
+
+        if not options.get(CONF_EXPORT_TELEMETRY, DEFAULT_EXPORT_TELEMETRY):
+            if self.exporter is not None:
+                self.hass.async_create_task(self.exporter.async_flush())
+                self.exporter = None
+            return
+
+        if self.exporter is None:
+            entry_id = self.config_entry.entry_id
+            self.exporter = TorchTelemetryExporter(
+                self.hass,
+                entry_id,
+                self.hass.config.path(DOMAIN, f"telemetry_{entry_id}.lp"),
+                max_size,
+            )
+
+        self.exporter.max_size = max_size
+
+    @callback
+    def async_start_replay(self, source: TorchUpdateSource) -> None:
+        """Drive the entry from recorded polls, setting the live state aside.
+
+        The replay starts with an empty change filter, statistics and fault
+        detection, so the live readings do not leak into it.
+        """
+
+        self._live_state = (
+            self.update_source,
+            self.data,
+            self._change_filter,
+            self.statistics,
+            self.anomalies,
+        )
+        self.update_source = source
+        self._change_filter = TorchChangeFilter(self.config_entry.options)
+        self.statistics = TorchDerivedStatistics()
+        self.anomalies = TorchAnomalyDetector()
+
+    @callback
+    def async_stop_replay(self) -> None:
+        """Resume the live state set aside for a replay.
+
+        Every entity is notified, so none keeps showing a replayed reading.
+        """
+
+        if self._live_state is None:
+            return
+
+        (
+            self.update_source,
+            self.data,
+            self._change_filter,
+            self.statistics,
+            self.anomalies,
+        ) = self._live_state
+        self._live_state = None
+        self._change_filter.apply_options(self.config_entry.options)
+
+        self._listeners_saw_success = None
+        self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the polls and write the statistics and telemetry still buffered."""
+
+        await super().async_shutdown()
+        await self.long_term_statistics.async_shutdown()
+
+        if self.exporter is not None:
+            await self.exporter.async_flush()
+
+    async def async_refresh_burner_state(self) -> TorchPelletSystemSnapshot:
+        """Fetch the burner state right away to confirm a switch command.
+
+        The confirmed state is published with the other readings of the last
+        poll, and a short burst of fast polls follows the burner afterwards.
+        """
+
+        returned_data = await self.api.get_data(BURNER_STATE_DATA_KEYS)
+
+        self._fast_polls_remaining = FAST_POLLING_BURST
+        snapshot = self._async_publish(returned_data)
+
+        self.async_set_updated_data(snapshot)
+
+        return snapshot
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the entities whose data changed since the last update.
+
+        Entities register with the data key they show as their context. All
+        entities are notified when the data becomes unavailable or stale, or
+        recovers, and the entities showing request metrics after every update.
+        """
+
+        changed_keys, self._changed_keys = self._changed_keys, {METRICS_CONTEXT}
+        stale = bool(self.data and self.data.stale)
+
+        if (
+            self.last_update_success != self._listeners_saw_success
+            or stale != self._listeners_saw_stale
+        ):
+            self._listeners_saw_success = self.last_update_success
+            self._listeners_saw_stale = stale
+            super().async_update_listeners()
+            return
 
-    async def _async_update_data(self) -> dict[Platform, dict[str, int | str]]:
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed_keys:
+                update_callback()
+
+    def _next_update_interval(self, snapshot: TorchPelletSystemSnapshot) -> timedelta:
+        """Return the interval until the next poll."""
+
+        interval = self.polling_policy.interval_for(snapshot)
+
+        if self.poll_offset:
+            interval += self.poll_offset
+            self.poll_offset = timedelta()
+
+        if self._fast_polls_remaining:
+            self._fast_polls_remaining -= 1
+            return min(interval, self.polling_policy.fast_interval)
+
+        return interval
+
+    async def _async_update_data(self) -> TorchPelletSystemSnapshot:
         """Get the latest data from Torch Pellet System API and update the state."""
 
-        data = {}
+        try:
+            returned_data = await self.update_source.async_fetch()
+        except TorchAuthenticationError as error:
+            raise ConfigEntryAuthFailed(error) from error
+        except TorchApiError as error:
+            return self._async_serve_stale(error)
+
+        if not self.update_source.is_supported:
+            LOGGER.debug(
+                "The %s update source is not supported, falling back to polling",
+                self.update_source.name,
+            )
+            self.update_source = TorchPollingSource(self.api)
+
+        return self._async_publish(returned_data)
+
+    @callback
+    def _async_serve_stale(self, error: TorchApiError) -> TorchPelletSystemSnapshot:
+        """Serve the last good snapshot while the polls fail.
+
+        Entities stay available with the last readings, marked as stale,
+        until they are older than the configured bound. Meanwhile the data is
+        revalidated at the fast interval, so a short outage is over within
+        seconds. During a longer one, the open circuit breaker keeps the fast
+        polls from reaching the cloud.
+        """
+
+        if self.data is None or (
+            dt_util.utcnow() - self.data.timestamp > self.polling_policy.max_stale_age
+        ):
+            raise UpdateFailed(error) from error
+
+        LOGGER.debug("Serving the last readings after a failed poll: %s", error)
+        self.update_interval = self.polling_policy.fast_interval
+
+        return dataclasses.replace(self.data, stale=True)
+
+    @callback
+    def _async_publish(
+        self, returned_data: Mapping[str, str] | None
+    ) -> TorchPelletSystemSnapshot:
+        """Take in fetched data and return the snapshot to publish.
+
+        No data means it is unchanged since the last update, so the last
+        snapshot is published again with the current time.
+        """
+
+        if returned_data is None and self.data is not None:
+            snapshot = dataclasses.replace(
+                self.data, timestamp=self.update_source.now(), stale=False
+            )
+            self._async_process(snapshot, None)
+
+            return snapshot
+
+        returned_data = returned_data or {}
+
+        if self.reading_keys is None:
+            self.variable_keys = frozenset(returned_data)
+            self.reading_keys = frozenset(
+                key
+                for key, value in returned_data.items()
+                if key not in SENSOR_DATA_KEYS and is_numeric(value)
+            )
+
+        self._changed_keys |= self._change_filter.update(returned_data)
+
+        snapshot = TorchPelletSystemSnapshot.from_data(
+            self._change_filter.values, self.update_source.now(), self.reading_keys
+        )
+
+        self._async_process(snapshot, returned_data)
+
+        return snapshot
+
+    @callback
+    def _async_process(
+        self,
+        snapshot: TorchPelletSystemSnapshot,
+        returned_data: Mapping[str, str] | None,
+    ) -> None:
+        """Run the stages following a poll on the snapshot to publish.
+
+        Replayed polls are kept out of the long-term statistics, the
+        telemetry export and the anomaly events, which only record the live
+        pellet system.
+        """
+
+        self._changed_keys |= self.statistics.update(snapshot)
+
+        if not self.update_source.recorded:
+            self.long_term_statistics.update(snapshot, self.update_interval)
+            if self.exporter is not None:
+                self.exporter.add(snapshot.timestamp, returned_data)
+
+        burner_temperature = (
+            to_float(returned_data.get(PELLET_BURNER_TEMPERATURE_KEY))
+            if returned_data
+            else None
+        )
+
+        changed_anomalies = self.anomalies.update(snapshot, burner_temperature)
 
-        returned_data = await self.hass.async_add_executor_job(self.api.get_data)
+        if not self.update_source.recorded:
+            for key in changed_anomalies:
+                self.hass.bus.async_fire(
+                    EVENT_ANOMALY,
+                    {
+                        "entry_id": self.config_entry.entry_id,
+                        "anomaly": key,
+                        "active": self.anomalies.active[key],
+                    },
+                )
 
-        data[Platform.SENSOR] = returned_data
-        data[Platform.SWITCH] = returned_data
+        self._changed_keys |= changed_anomalies
 
-        return data
+        self.update_interval = self._next_update_interval(snapshot)
@@ -0,0 +1,168 @@
+"""Statistics derived from the polled Torch Pellet System readings."""
+from __future__ import annotations
+
+from array import array
+
+from .const import (
+    BURN_DUTY_CYCLE_KEY,
+    PELLET_CONSUMPTION_RATE_KEY,
+    PELLET_ENERGY_DENSITY,
+    STATISTICS_BUFFER_SIZE,
+    STATISTICS_WINDOW,
+    TEMPERATURE_DELTA_KEY,
+    THERMAL_EFFICIENCY_KEY,
+)
+from .models import PelletSystemState, TorchPelletSystemSnapshot
+
+
+class TorchRollingWindow:
+    """Time window of poll intervals kept in a circular buffer of arrays.
+
+    Each interval stores its duration, the time the burner was burning, the
+    burned pellets and the produced energy. Running sums are updated when an
+    interval enters or leaves the window, so every poll costs O(1).
+    """
+
+    def __init__(self, window: float, capacity: int) -> None:
+        """Initialize an empty window."""
+
+        self._window = window
+        self._capacity = capacity
+        self._ends = array("d", bytes(8 * capacity))
+        self._durations = array("d", bytes(8 * capacity))
+        self._burning = array("d", bytes(8 * capacity))
+        self._pellets = array("d", bytes(8 * capacity))
+        self._energy = array("d", bytes(8 * capacity))
+        self._start = 0
+        self._length = 0
+
+        self.duration = 0.0
+        self.burning = 0.0
+        self.pellets = 0.0
+        self.energy = 0.0
+
+    def push(
+        self,
+        end: float,
+        duration: float,
+        burning: float,
+        pellets: float,
+        energy: float,
+    ) -> None:
+        """Add the interval ending at the given timestamp and evict old ones."""
+
+        while self._length and (
+            self._length == self._capacity
+            or self._ends[self._start] <= end - self._window
+        ):
+            self._evict()
+
+        index = (self._start + self._length) % self._capacity
+        self._ends[index] = end
+        self._durations[index] = duration
+        self._burning[index] = burning
+        self._pellets[index] = pellets
+        self._energy[index] = energy
+        self._length += 1
+
+        self.duration += duration
+        self.burning += burning
+        self.pellets += pellets
+        self.energy += energy
+
+    def _evict(self) -> None:
+        """Remove the oldest interval from the window."""
+
+        index = self._start
+        self.duration -= self._durations[index]
+        self.burning -= self._burning[index]
+        self.pellets -= self._pellets[index]
+        self.energy -= self._energy[index]
+
+        self._start = (index + 1) % self._capacity
+        self._length -= 1
+
+
+class TorchDerivedStatistics:
+    """Rolling statistics of the pellet burner, updated once per poll."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics without any readings."""
+
+        self._window = TorchRollingWindow(STATISTICS_WINDOW, STATISTICS_BUFFER_SIZE)
+        self._previous: TorchPelletSystemSnapshot | None = None
+        self.values: dict[str, float | None] = {
+            PELLET_CONSUMPTION_RATE_KEY: None,
+            BURN_DUTY_CYCLE_KEY: None,
+            TEMPERATURE_DELTA_KEY: None,
+            THERMAL_EFFICIENCY_KEY: None,
+        }
+
+    def update(self, snapshot: TorchPelletSystemSnapshot) -> set[str]:
+        """Take in a new snapshot and return the keys whose value changed."""
+
+        previous, self._previous = self._previous, snapshot
+
+        if previous is not None and (
+            duration := (snapshot.timestamp - previous.timestamp).total_seconds()
+        ) > 0:
+            self._window.push(
+                snapshot.timestamp.timestamp(),
+                duration,
+                duration
+                if previous.pellet_system_state is PelletSystemState.BURNING
+                else 0.0,
+                pellets_burned(previous.burned_pellets, snapshot.burned_pellets),
+                (previous.burner_power or 0.0) * duration / 3600,
+            )
+
+        return self._update_values(snapshot)
+
+    def _update_values(self, snapshot: TorchPelletSystemSnapshot) -> set[str]:
+        """Recompute the values from the running sums."""
+
+        window = self._window
+        values: dict[str, float | None] = dict.fromkeys(self.values)
+
+        if window.duration:
+            values[PELLET_CONSUMPTION_RATE_KEY] = round(
+                window.pellets * 3600 / window.duration, 3
+            )
+            values[BURN_DUTY_CYCLE_KEY] = round(
+                window.burning * 100 / window.duration, 1
+            )
+
+        if window.pellets > 0:
+            values[THERMAL_EFFICIENCY_KEY] = round(
+                window.energy * 100 / (window.pellets * PELLET_ENERGY_DENSITY), 1
+            )
+
+        if (
+            snapshot.water_temperature_out is not None
+            and snapshot.water_temperature_in is not None
+        ):
+            values[TEMPERATURE_DELTA_KEY] = round(
+                snapshot.water_temperature_out - snapshot.water_temperature_in, 1
+            )
+
+        changed_keys = {
+            key for key, value in values.items() if value != self.values[key]
+        }
+        self.values = values
+
+        return changed_keys
+
+
+def pellets_burned(previous: float | None, current: float | None) -> float:
+    """Return the pellets burned between two readings of the pellet counter.
+
+    A counter lower than before was reset by the cloud and counts from zero.
+    """
+
+    if previous is None or current is None:
+        return 0.0
+
+    if current < previous:
+        return current
+
+    return current - previous
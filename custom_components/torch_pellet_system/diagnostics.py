@@ -0,0 +1,42 @@
+"""Diagnostics support for the Torch Pellet System integration."""
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import TorchPelletSystemDataUpdateCoordinator
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, "session_cookie", "Cookie"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    coordinator: TorchPelletSystemDataUpdateCoordinator = hass.data[DOMAIN][
+        entry.entry_id
+    ]
+    api = coordinator.api
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "data": dataclasses.asdict(coordinator.data) if coordinator.data else None,
+            "statistics": coordinator.statistics.values,
+        },
+        "api": {
+            "session_valid": api.session_manager.is_valid,
+            "session_expires_at": api.session_manager.expires_at,
+            "circuit_open": api.circuit_breaker.is_open,
+            "metrics": api.metrics.as_dict(),
+        },
+    }
@@ -0,0 +1,181 @@
+"""Export of the Torch Pellet System telemetry to local time-series files."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from datetime import datetime
+import os
+import re
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import EXPORT_BACKUP_COUNT, EXPORT_BATCH_SIZE, EXPORT_FLUSH_INTERVAL
+
+_MEASUREMENT = "torch_pellet_system"
+
+_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+# A field of the line protocol: an escaped key and a quoted or bare value
+_FIELD = re.compile(r'((?:[^\\,= ]|\\.)+)=("(?:[^"\\]|\\.)*"|[^,]*)(?:,|$)')
+_UNESCAPE = re.compile(r"\\(.)")
+
+
+def _escape_key(key: str) -> str:
+    """Escape a tag or field key of the line protocol."""
+
+    return key.replace(",", r"\,").replace("=", r"\=").replace(" ", r"\ ")
+
+
+def _field_value(value: str | int | float) -> str:
+    """Encode a raw variable value as a field value of the line protocol.
+
+    Numbers are written as they were received, which the line protocol reads
+    as floats, and everything else as a string.
+    """
+
+    value = str(value)
+
+    if _NUMBER.fullmatch(value):
+        return value
+
+    return '"{}"'.format(value.replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def encode_line(
+    entry_id: str, timestamp: datetime, data: Mapping[str, str]
+) -> str | None:
+    """Encode the variables of one poll as a line of InfluxDB line protocol.
+
+    Values that are not scalars, such as a missing value or a nested list,
+    have no line protocol type and are left out, and None is returned when no
+    value is left. The timestamp is written in nanoseconds with the
+    microseconds of the poll.
+    """
+
+    fields = ",".join(
+        f"{_escape_key(key)}={_field_value(value)}"
+        for key, value in sorted(data.items())
+        if isinstance(value, (str, int, float))
+    )
+
+    if not fields:
+        return None
+
+    return "{},entry={} {} {}\n".format(
+        _MEASUREMENT,
+        _escape_key(entry_id),
+        fields,
+        round(timestamp.timestamp() * 1_000_000) * 1000,
+    )
+
+
+def decode_line(line: str) -> tuple[datetime, dict[str, str]] | None:
+    """Decode a line written by the export into its time and variables.
+
+    Lines that were not written by the export are skipped with None.
+    """
+
+    series, _, line = line.partition(" ")
+    fields, _, timestamp = line.rstrip("\n").rpartition(" ")
+
+    if not series.startswith(f"{_MEASUREMENT},") or not timestamp.isdigit():
+        return None
+
+    data: dict[str, str] = {}
+
+    for match in _FIELD.finditer(fields):
+        key, value = match.groups()
+        if value.startswith('"'):
+            value = _UNESCAPE.sub(r"\1", value[1:-1])
+        data[_UNESCAPE.sub(r"\1", key)] = value
+
+    if not data:
+        return None
+
+    return dt_util.utc_from_timestamp(int(timestamp) / 1_000_000_000), data
+
+
+class TorchTelemetryExporter:
+    """Append every poll of an entry to a rotating file of line protocol.
+
+    The lines are buffered in memory and written in batches by the executor,
+    either once a batch is full or once the oldest buffered line has waited
+    for the flush interval. All variables of the payload are exported. The
+    file is rotated through a few backups, so the export never takes more
+    than the configured size.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, path: str, max_size: int
+    ) -> None:
+        """Initialize the exporter writing to the given file."""
+
+        self._hass = hass
+        self._entry_id = entry_id
+        self._path = path
+        self.max_size = max_size
+        self._values: dict[str, str] = {}
+        self._lines: list[str] = []
+        self._buffered_since = 0.0
+        self._write_lock = asyncio.Lock()
+
+    @callback
+    def add(self, timestamp: datetime, data: Mapping[str, str] | None) -> None:
+        """Buffer the variables of a poll, flushing a full batch.
+
+        Partial data updates the last exported variables, and no data
+        exports them again as unchanged.
+        """
+
+        if data:
+            self._values.update(data)
+
+        if not self._values or not (
+            line := encode_line(self._entry_id, timestamp, self._values)
+        ):
+            return
+
+        if not self._lines:
+            self._buffered_since = time.monotonic()
+
+        self._lines.append(line)
+
+        if (
+            len(self._lines) >= EXPORT_BATCH_SIZE
+            or time.monotonic() - self._buffered_since >= EXPORT_FLUSH_INTERVAL
+        ):
+            self._hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write the buffered lines to the file."""
+
+        if not self._lines:
+            return
+
+        lines, self._lines = self._lines, []
+
+        async with self._write_lock:
+            await self._hass.async_add_executor_job(self._write, "".join(lines))
+
+    def _write(self, text: str) -> None:
+        """Append to the export file, rotating it when it is full."""
+
+        data = text.encode()
+        max_file_size = self.max_size // (EXPORT_BACKUP_COUNT + 1)
+
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+
+        try:
+            size = os.path.getsize(self._path)
+        except FileNotFoundError:
+            size = 0
+
+        if size and size + len(data) > max_file_size:
+            for index in range(EXPORT_BACKUP_COUNT - 1, 0, -1):
+                if os.path.exists(source := f"{self._path}.{index}"):
+                    os.replace(source, f"{self._path}.{index + 1}")
+            os.replace(self._path, f"{self._path}.1")
+
+        with open(self._path, "ab") as export_file:
+            export_file.write(data)
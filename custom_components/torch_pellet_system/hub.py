@@ -0,0 +1,258 @@
+"""Connections and logins shared by all Torch Pellet System entries."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+import hashlib
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_HUB, STORAGE_KEY, STORAGE_VERSION
+from .torch_api import AsyncTorchApi, create_trace_config
+
+# Spreads the first polls of the entries evenly over the polling interval,
+# whatever the number of entries.
+_GOLDEN_RATIO_CONJUGATE = 0.6180339887
+
+# Delay before renewed sessions are written to storage
+_SAVE_DELAY = 10
+
+
+def _credentials_fingerprint(username: str, password: str) -> str:
+    """Return a digest telling the credentials a session was logged in with."""
+
+    return hashlib.sha256(f"{username}\0{password}".encode()).hexdigest()
+
+
+@dataclass
+class _TorchAccount:
+    """An API client shared by the entries logged in with the same credentials."""
+
+    api: AsyncTorchApi
+    entry_ids: set[str] = field(default_factory=set)
+
+
+class TorchHub:
+    """Share connections and logins to the Torch Web Interface between entries.
+
+    All entries send their requests through one keep-alive connection pool.
+    Each account keeps its own session, and entries with the same
+    credentials share one API client and therefore one login. Sessions are
+    persisted, so a restart or reload reuses them while they are valid.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+
+        self._hass = hass
+        self._session: aiohttp.ClientSession | None = None
+        self._accounts: dict[tuple[str, str], _TorchAccount] = {}
+        self._poll_slots: dict[str, int] = {}
+        self._next_poll_slot = 0
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._stored_sessions: dict[str, dict[str, Any]] | None = None
+
+    async def async_get_api(self, entry: ConfigEntry) -> AsyncTorchApi:
+        """Return the API client for the account of an entry."""
+
+        credentials = (entry.data["username"], entry.data["password"])
+
+        if (account := self._accounts.get(credentials)) is None:
+            api = AsyncTorchApi(self._async_get_session(), *credentials)
+            await self._async_restore_session(api)
+
+            account = self._accounts[credentials] = _TorchAccount(api)
+
+        account.entry_ids.add(entry.entry_id)
+
+        return account.api
+
+    async def async_validate_credentials(self, username: str, password: str) -> None:
+        """Log in once with the credentials of a new entry.
+
+        The session is persisted, so setting up the entry afterwards does not
+        need to log in again.
+        """
+
+        api = AsyncTorchApi(self._async_get_session(), username, password)
+        await self._async_load_sessions()
+
+        try:
+            await api.session_manager.async_renew()
+        finally:
+            api.close()
+
+        self._async_remember_session(api)
+
+    async def async_update_credentials(
+        self, entry: ConfigEntry, username: str, password: str
+    ) -> set[str] | None:
+        """Switch the running API client of an entry to new credentials.
+
+        The credentials are checked with a single login, whose session the
+        client takes over, so the client, its connections and the coordinator
+        keep running. Entries sharing the client switch along, and their ids
+        are returned. None is returned when the entry has no running client,
+        or when another client is already logged in with the new credentials.
+        """
+
+        await self.async_validate_credentials(username, password)
+
+        credentials = (entry.data["username"], entry.data["password"])
+        new_credentials = (username, password)
+
+        if (account := self._accounts.get(credentials)) is None or (
+            new_credentials != credentials and new_credentials in self._accounts
+        ):
+            return None
+
+        api = account.api
+
+        if username != api.CREDENTIALS_USERNAME:
+            self._stored_sessions.pop(api.CREDENTIALS_USERNAME, None)
+            self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+        del self._accounts[credentials]
+        self._accounts[new_credentials] = account
+
+        api.update_credentials(username, password)
+        await self._async_restore_session(api)
+
+        return set(account.entry_ids)
+
+    async def async_release_api(self, entry: ConfigEntry) -> None:
+        """Release the API client of an entry that is unloaded.
+
+        The client is closed once no entry uses its account anymore, and the
+        connection pool once no account is left.
+        """
+
+        self._poll_slots.pop(entry.entry_id, None)
+
+        for credentials, account in list(self._accounts.items()):
+            account.entry_ids.discard(entry.entry_id)
+
+            if not account.entry_ids:
+                account.api.close()
+                del self._accounts[credentials]
+
+        if not self._accounts and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @callback
+    def async_poll_offset(self, entry: ConfigEntry, interval: timedelta) -> timedelta:
+        """Return how long to delay the polls of an entry.
+
+        The offsets keep the entries from polling the Torch Web Interface at
+        the same moment.
+        """
+
+        if (poll_slot := self._poll_slots.get(entry.entry_id)) is None:
+            poll_slot = self._poll_slots[entry.entry_id] = self._next_poll_slot
+            self._next_poll_slot += 1
+
+        return interval * ((poll_slot * _GOLDEN_RATIO_CONJUGATE) % 1)
+
+    async def _async_load_sessions(self) -> None:
+        """Load the persisted sessions the first time they are needed."""
+
+        if self._stored_sessions is None:
+            stored_data = await self._store.async_load() or {}
+            self._stored_sessions = stored_data.get("sessions", {})
+
+    async def _async_restore_session(self, api: AsyncTorchApi) -> None:
+        """Reuse the persisted session of an account and persist its renewals.
+
+        A session is only reused with the credentials it was logged in with,
+        so an entry with the same username and another password has to log
+        in itself.
+        """
+
+        await self._async_load_sessions()
+
+        stored_session = self._stored_sessions.get(api.CREDENTIALS_USERNAME)
+        fingerprint = _credentials_fingerprint(
+            api.CREDENTIALS_USERNAME, api.CREDENTIALS_PASSWORD
+        )
+
+        if stored_session and stored_session.get("credentials") == fingerprint:
+            api.session_manager.restore(
+                stored_session["session_cookie"], stored_session["expires_at"]
+            )
+
+        api.session_manager.on_renewed = lambda: self._async_remember_session(api)
+
+    @callback
+    def _async_remember_session(self, api: AsyncTorchApi) -> None:
+        """Persist the current session of an account."""
+
+        session_manager = api.session_manager
+
+        self._stored_sessions[api.CREDENTIALS_USERNAME] = {
+            "session_cookie": session_manager.session_cookie,
+            "expires_at": session_manager.expires_at,
+            "credentials": _credentials_fingerprint(
+                api.CREDENTIALS_USERNAME, api.CREDENTIALS_PASSWORD
+            ),
+        }
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the sessions to persist, leaving out expired ones."""
+
+        now = time.time()
+
+        return {
+            "sessions": {
+                username: stored_session
+                for username, stored_session in self._stored_sessions.items()
+                if stored_session["expires_at"] > now
+            }
+        }
+
+    @callback
+    def _async_get_session(self) -> aiohttp.ClientSession:
+        """Return the connection pool, creating it when needed.
+
+        The Torch session cookie is sent explicitly by each API client, so
+        the shared pool does not keep any cookies itself. The trace config
+        counts the connections each client opens.
+        """
+
+        if self._session is None:
+            self._session = async_create_clientsession(
+                self._hass,
+                verify_ssl=False,
+                auto_cleanup=False,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                trace_configs=[create_trace_config()],
+            )
+
+        return self._session
+
+    async def _async_close(self, event: Event) -> None:
+        """Close the connection pool when Home Assistant stops."""
+
+        if self._session is not None:
+            await self._session.close()
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> TorchHub:
+    """Return the hub shared by all entries, creating it when needed."""
+
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = TorchHub(hass)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, hub._async_close)
+
+    return hub
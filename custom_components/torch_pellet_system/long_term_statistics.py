@@ -0,0 +1,222 @@
+"""Hourly long-term statistics of the Torch Pellet System for the recorder."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfMass, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STATISTICS_STORAGE_KEY, STORAGE_VERSION
+from .derived import pellets_burned
+from .models import PelletSystemState, TorchPelletSystemSnapshot
+
+_HOUR = 3600
+
+# Delay before the state of the statistics is written to storage
+_SAVE_DELAY = 60
+
+# Intervals longer than this many expected intervals are gaps in the polling
+_GAP_FACTOR = 2
+
+
+def _statistics_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store keeping the statistics state of an entry."""
+
+    return Store(hass, STORAGE_VERSION, f"{STATISTICS_STORAGE_KEY}.{entry_id}")
+
+
+async def async_remove_statistics_state(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted statistics state of a removed entry."""
+
+    await _statistics_store(hass, entry_id).async_remove()
+
+
+class TorchLongTermStatistics:
+    """Hourly pellet consumption and burn hours of an entry.
+
+    Every poll interval is split over the hours it overlaps. Once an hour is
+    over, its totals are imported into the recorder as external statistics,
+    so the long-term history does not depend on compiling the high-frequency
+    states of the sensors. The last reading and the unfinished hours are
+    persisted, so the interval spanning a restart is backfilled into the
+    hours it covers. Across a gap in the polling the pellets are spread over
+    the whole gap, but the burner is only taken to keep burning for one
+    expected interval after the last reading.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the statistics of an entry."""
+
+        self._hass = hass
+        self._store = _statistics_store(hass, entry.entry_id)
+
+        object_id = entry.entry_id.lower()
+        self._consumption_metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=f"{entry.title} pellet consumption",
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{object_id}_pellet_consumption",
+            unit_of_measurement=UnitOfMass.KILOGRAMS,
+        )
+        self._burn_hours_metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=f"{entry.title} burn hours",
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{object_id}_burn_hours",
+            unit_of_measurement=UnitOfTime.HOURS,
+        )
+
+        self._last_timestamp: float | None = None
+        self._last_burned_pellets: float | None = None
+        self._last_burning = False
+        # Burned pellets and burning seconds of the hours not imported yet,
+        # keyed by the timestamp of the start of the hour
+        self._hours: dict[int, list[float]] = {}
+        self._consumption_sum = 0.0
+        self._burn_hours_sum = 0.0
+
+    async def async_load(self) -> None:
+        """Restore the state persisted before the last restart."""
+
+        if not (stored_data := await self._store.async_load()):
+            return
+
+        self._last_timestamp = stored_data["last_timestamp"]
+        self._last_burned_pellets = stored_data["last_burned_pellets"]
+        self._last_burning = stored_data["last_burning"]
+        self._hours = {
+            int(hour): totals for hour, totals in stored_data["hours"].items()
+        }
+        self._consumption_sum = stored_data["consumption_sum"]
+        self._burn_hours_sum = stored_data["burn_hours_sum"]
+
+    async def async_shutdown(self) -> None:
+        """Write the state right away when the entry is unloaded.
+
+        This replaces the delayed write still pending, which would otherwise
+        write the state again after the entry is removed.
+        """
+
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def update(
+        self, snapshot: TorchPelletSystemSnapshot, expected_interval: timedelta
+    ) -> None:
+        """Take in a new snapshot and import the hours that are over.
+
+        The expected interval is the polling interval the snapshot was due
+        after the previous one.
+        """
+
+        timestamp = snapshot.timestamp.timestamp()
+
+        if snapshot.stale or (
+            self._last_timestamp is not None and timestamp <= self._last_timestamp
+        ):
+            return
+
+        if self._last_timestamp is not None:
+            expected_seconds = expected_interval.total_seconds()
+            burning_end = (
+                timestamp
+                if timestamp - self._last_timestamp <= _GAP_FACTOR * expected_seconds
+                else self._last_timestamp + expected_seconds
+            )
+            self._split_interval(
+                self._last_timestamp,
+                timestamp,
+                pellets_burned(self._last_burned_pellets, snapshot.burned_pellets),
+                burning_end if self._last_burning else self._last_timestamp,
+            )
+
+        self._last_timestamp = timestamp
+        if snapshot.burned_pellets is not None:
+            self._last_burned_pellets = snapshot.burned_pellets
+        self._last_burning = snapshot.pellet_system_state is PelletSystemState.BURNING
+
+        self._async_import_finished_hours(timestamp)
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    def _split_interval(
+        self, start: float, end: float, pellets: float, burning_end: float
+    ) -> None:
+        """Add the totals of an interval to the hours it overlaps.
+
+        The pellets are spread over the whole interval, and the burner was
+        burning from its start until the burning end.
+        """
+
+        duration = end - start
+        hour = int(start // _HOUR) * _HOUR
+
+        while hour < end:
+            overlap = min(end, hour + _HOUR) - max(start, hour)
+            totals = self._hours.setdefault(hour, [0.0, 0.0])
+            totals[0] += pellets * overlap / duration
+            totals[1] += max(min(burning_end, hour + _HOUR) - max(start, hour), 0.0)
+            hour += _HOUR
+
+    @callback
+    def _async_import_finished_hours(self, now: float) -> None:
+        """Import the totals of the hours before the current one."""
+
+        current_hour = int(now // _HOUR) * _HOUR
+
+        finished_hours = sorted(hour for hour in self._hours if hour < current_hour)
+
+        if not finished_hours:
+            return
+
+        consumption: list[StatisticData] = []
+        burn_hours: list[StatisticData] = []
+
+        for hour in finished_hours:
+            pellets, burning = self._hours.pop(hour)
+            start = dt_util.utc_from_timestamp(hour)
+
+            self._consumption_sum += pellets
+            self._burn_hours_sum += burning / _HOUR
+
+            consumption.append(
+                StatisticData(
+                    start=start,
+                    state=round(pellets, 3),
+                    sum=round(self._consumption_sum, 3),
+                )
+            )
+            burn_hours.append(
+                StatisticData(
+                    start=start,
+                    state=round(burning / _HOUR, 3),
+                    sum=round(self._burn_hours_sum, 3),
+                )
+            )
+
+        async_add_external_statistics(
+            self._hass, self._consumption_metadata, consumption
+        )
+        async_add_external_statistics(
+            self._hass, self._burn_hours_metadata, burn_hours
+        )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the state to persist."""
+
+        return {
+            "last_timestamp": self._last_timestamp,
+            "last_burned_pellets": self._last_burned_pellets,
+            "last_burning": self._last_burning,
+            "hours": self._hours,
+            "consumption_sum": self._consumption_sum,
+            "burn_hours_sum": self._burn_hours_sum,
+        }
@@ -0,0 +1,153 @@
+"""Data models for the Torch Pellet System integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+from .const import (
+    BURNED_PELLETS_QUANTITY,
+    BURNER_CURRENT_WORKING_POWER_KEY,
+    LIGTH_SENSOR_KEY,
+    PELLET_BURNER_TEMPERATURE_KEY,
+    PELLET_SYSTEM_STATE_KEY,
+    PELLET_SYSTEM_TNC_STATUS_KEY,
+    WATER_TEMPERATURE_COMING_IN_THE_PELLET_SYSTEM_KEY,
+    WATER_TEMPERATURE_OUT_OF_THE_PELLET_SYSTEM_KEY,
+    WATER_TEMPERATURE_SETTING_KEY,
+)
+
+
+class PelletSystemState(StrEnum):
+    """State of the pellet burner."""
+
+    TURNED_OFF = "Turned Off"
+    STARTING = "Starting"
+    BURNING = "Burning"
+    COOLING_DOWN = "Cooling Down"
+    WAITING = "Waiting"
+    UNKNOWN = "Unknown State"
+
+
+class TorchNetControlStatus(StrEnum):
+    """Status of the link between the pellet burner and the Torch cloud."""
+
+    OFFLINE = "Offline"
+    ONLINE = "Online"
+    UNKNOWN = "Unknown State"
+
+
+PELLET_SYSTEM_STATES: dict[str, PelletSystemState] = {
+    "0": PelletSystemState.TURNED_OFF,
+    "1": PelletSystemState.STARTING,
+    "3": PelletSystemState.BURNING,
+    "4": PelletSystemState.COOLING_DOWN,
+    "5": PelletSystemState.COOLING_DOWN,
+    "6": PelletSystemState.WAITING,
+}
+
+TORCH_NET_CONTROL_STATUSES: dict[str, TorchNetControlStatus] = {
+    "0": TorchNetControlStatus.OFFLINE,
+    "1": TorchNetControlStatus.ONLINE,
+}
+
+# Burner state codes the switch reports as off
+PELLET_SYSTEM_OFF_STATE_CODES = frozenset(("0", "4"))
+
+
+def is_numeric(value: object) -> bool:
+    """Return whether a raw variable value is a number."""
+
+    return to_float(value) is not None
+
+
+def _to_code(value: object) -> str | None:
+    """Return a state code as a string, None when it is missing or not a scalar."""
+
+    if not isinstance(value, (str, int, float)):
+        return None
+
+    return str(value)
+
+
+def to_float(value: object) -> float | None:
+    """Parse a numeric reading, returning None when it is missing or invalid."""
+
+    if value is None:
+        return None
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class TorchPelletSystemSnapshot:
+    """Readings of the pellet system decoded once per poll."""
+
+    timestamp: datetime
+    pellet_system_state_code: str | None
+    pellet_system_state: PelletSystemState
+    tnc_status: TorchNetControlStatus
+    water_temperature_setting: float | None
+    water_temperature_out: float | None
+    water_temperature_in: float | None
+    burner_temperature: float | None
+    flame_light: float | None
+    burner_power: float | None
+    burned_pellets: float | None
+    # Discovered numeric variables without a dedicated field, by variable id
+    readings: Mapping[str, float | None]
+    # Set when the readings are served again because the cloud is unreachable
+    stale: bool = False
+
+    @property
+    def is_burner_on(self) -> bool:
+        """Return whether the burner is switched on."""
+
+        return (
+            self.pellet_system_state_code is not None
+            and self.pellet_system_state_code not in PELLET_SYSTEM_OFF_STATE_CODES
+        )
+
+    @classmethod
+    def from_data(
+        cls,
+        data: Mapping[str, str],
+        timestamp: datetime,
+        reading_keys: Iterable[str] = (),
+    ) -> TorchPelletSystemSnapshot:
+        """Decode the raw variables returned by the Torch Web Interface.
+
+        The reading keys are the discovered variables decoded into readings.
+        """
+
+        state_code = _to_code(data.get(PELLET_SYSTEM_STATE_KEY))
+
+        return cls(
+            timestamp=timestamp,
+            pellet_system_state_code=state_code,
+            pellet_system_state=PELLET_SYSTEM_STATES.get(
+                state_code, PelletSystemState.UNKNOWN
+            ),
+            tnc_status=TORCH_NET_CONTROL_STATUSES.get(
+                _to_code(data.get(PELLET_SYSTEM_TNC_STATUS_KEY)),
+                TorchNetControlStatus.UNKNOWN,
+            ),
+            water_temperature_setting=to_float(
+                data.get(WATER_TEMPERATURE_SETTING_KEY)
+            ),
+            water_temperature_out=to_float(
+                data.get(WATER_TEMPERATURE_OUT_OF_THE_PELLET_SYSTEM_KEY)
+            ),
+            water_temperature_in=to_float(
+                data.get(WATER_TEMPERATURE_COMING_IN_THE_PELLET_SYSTEM_KEY)
+            ),
+            burner_temperature=to_float(data.get(PELLET_BURNER_TEMPERATURE_KEY)),
+            flame_light=to_float(data.get(LIGTH_SENSOR_KEY)),
+            burner_power=to_float(data.get(BURNER_CURRENT_WORKING_POWER_KEY)),
+            burned_pellets=to_float(data.get(BURNED_PELLETS_QUANTITY)),
+            readings={key: to_float(data.get(key)) for key in reading_keys},
+        )
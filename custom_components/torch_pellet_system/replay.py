@@ -0,0 +1,88 @@
+"""Replay of recorded polls through a running Torch Pellet System entry."""
+from __future__ import annotations
+
+import asyncio
+import resource
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .coordinator import TorchPelletSystemDataUpdateCoordinator
+from .update_source import TorchReplaySource
+
+
+async def async_replay(
+    hass: HomeAssistant,
+    coordinator: TorchPelletSystemDataUpdateCoordinator,
+    path: str,
+    speed: float,
+) -> dict[str, Any]:
+    """Drive an entry from the polls recorded in a telemetry export file.
+
+    The recorded polls go through the real coordinator and entities with the
+    current options, so polling, deadbands, statistics and fault detection
+    can be tuned against a season of data. The polls are replayed the given
+    number of times faster than recorded, or as fast as possible with a speed
+    of 0. The replay starts from fresh statistics and fault detection and
+    fires no anomaly events. Live polling resumes with the live state once
+    the file is replayed.
+
+    Returns the throughput, the state writes of the entities of the entry and
+    the peak memory of the process.
+    """
+
+    entity_ids = {
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), coordinator.config_entry.entry_id
+        )
+    }
+    state_writes = 0
+
+    @callback
+    def _async_count_state_write(event: Event) -> None:
+        """Count the state changes of the entities of the entry."""
+
+        nonlocal state_writes
+        if event.data["entity_id"] in entity_ids:
+            state_writes += 1
+
+    source = TorchReplaySource(hass, path)
+    coordinator.async_start_replay(source)
+    unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, _async_count_state_write)
+
+    snapshots = 0
+    first_timestamp = None
+    started = time.perf_counter()
+
+    try:
+        while await source.async_has_more():
+            if speed and snapshots:
+                await asyncio.sleep(
+                    (source.next_timestamp - source.now()).total_seconds() / speed
+                )
+
+            await coordinator.async_refresh()
+            snapshots += 1
+            first_timestamp = first_timestamp or source.now()
+    finally:
+        elapsed = time.perf_counter() - started
+        unsubscribe()
+        coordinator.async_stop_replay()
+        await source.async_close()
+
+    await coordinator.async_request_refresh()
+
+    return {
+        "snapshots": snapshots,
+        "duration": round(elapsed, 3),
+        "recorded_duration": (source.now() - first_timestamp).total_seconds()
+        if first_timestamp
+        else 0.0,
+        "snapshots_per_second": round(snapshots / elapsed, 1) if elapsed else None,
+        "state_writes": state_writes,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
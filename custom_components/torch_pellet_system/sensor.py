@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -16,61 +16,34 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import *
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_platform
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.typing import StateType
 
 from . import TorchPelletSystemEntity
 from .coordinator import TorchPelletSystemDataUpdateCoordinator
+from .models import TorchPelletSystemSnapshot
+from .torch_api import TorchApiMetrics
 
 from .const import *
 
 
-def get_state(data: dict[str, float], key: str) -> str | float:
-    """Get current state of the Torch Pellet Sensor."""
-
-    data_value = data[key]
-
-    if key == PELLET_SYSTEM_STATE_KEY:
-        if data_value == "0":
-            return "Turned Off"
-        if data_value == "1":
-            return "Starting"
-        if data_value == "3":
-            return "Burning"
-        if data_value == "4" or data_value == "5":
-            return "Cooling Down"
-        if data_value == "6":
-            return "Waiting"
-
-        return "Unknown State"
-
-    if key == PELLET_SYSTEM_TNC_STATUS_KEY:
-        if data_value == "0":
-            return "Offline"
-        if data_value == "1":
-            return "Online"
-
-        return "Unknown State"
-
-    return data_value
-
-
 @dataclass
 class TorchPelletSystemSensorEntityDescription(SensorEntityDescription):
     """Class to describe a Torch Pellet System sensor."""
 
-    value: Callable[[dict[str, float]], Any] = lambda val: val
+    value: Callable[[TorchPelletSystemSnapshot], StateType] = lambda val: val
 
 
 SENSOR_TYPES: tuple[TorchPelletSystemSensorEntityDescription, ...] = (
     TorchPelletSystemSensorEntityDescription(
         key=PELLET_SYSTEM_STATE_KEY,
         name="Pellet System State",
-        value=lambda data: get_state(data, PELLET_SYSTEM_STATE_KEY),
+        value=attrgetter("pellet_system_state"),
     ),
     TorchPelletSystemSensorEntityDescription(
         key=PELLET_SYSTEM_TNC_STATUS_KEY,
         name="Pellet System Torch Net Control State",
-        value=lambda data: get_state(data, PELLET_SYSTEM_TNC_STATUS_KEY),
+        value=attrgetter("tnc_status"),
     ),
     TorchPelletSystemSensorEntityDescription(
         key=WATER_TEMPERATURE_SETTING_KEY,
@@ -78,7 +51,7 @@ SENSOR_TYPES: tuple[TorchPelletSystemSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value=lambda data: get_state(data, WATER_TEMPERATURE_SETTING_KEY),
+        value=attrgetter("water_temperature_setting"),
     ),
     TorchPelletSystemSensorEntityDescription(
         key=WATER_TEMPERATURE_OUT_OF_THE_PELLET_SYSTEM_KEY,
@@ -86,9 +59,7 @@ SENSOR_TYPES: tuple[TorchPelletSystemSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value=lambda data: get_state(
-            data, WATER_TEMPERATURE_OUT_OF_THE_PELLET_SYSTEM_KEY
-        ),
+        value=attrgetter("water_temperature_out"),
     ),
     TorchPelletSystemSensorEntityDescription(
         key=WATER_TEMPERATURE_COMING_IN_THE_PELLET_SYSTEM_KEY,
@@ -96,9 +67,7 @@ SENSOR_TYPES: tuple[TorchPelletSystemSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value=lambda data: get_state(
-            data, WATER_TEMPERATURE_COMING_IN_THE_PELLET_SYSTEM_KEY
-        ),
+        value=attrgetter("water_temperature_in"),
     ),
     TorchPelletSystemSensorEntityDescription(
         key=PELLET_BURNER_TEMPERATURE_KEY,
@@ -106,14 +75,14 @@ SENSOR_TYPES: tuple[TorchPelletSystemSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value=lambda data: get_state(data, PELLET_BURNER_TEMPERATURE_KEY),
+        value=attrgetter("burner_temperature"),
     ),
     TorchPelletSystemSensorEntityDescription(
         key=LIGTH_SENSOR_KEY,
         name="Flame Light Sensor",
         device_class=SensorDeviceClass.ILLUMINANCE,
         state_class=SensorStateClass.MEASUREMENT,
-        value=lambda data: get_state(data, LIGTH_SENSOR_KEY),
+        value=attrgetter("flame_light"),
     ),
     TorchPelletSystemSensorEntityDescription(
         key=BURNER_CURRENT_WORKING_POWER_KEY,
@@ -121,7 +90,7 @@ SENSOR_TYPES: tuple[TorchPelletSystemSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        value=lambda data: get_state(data, BURNER_CURRENT_WORKING_POWER_KEY),
+        value=attrgetter("burner_power"),
     ),
     TorchPelletSystemSensorEntityDescription(
         key=BURNED_PELLETS_QUANTITY,
@@ -129,7 +98,126 @@ SENSOR_TYPES: tuple[TorchPelletSystemSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WEIGHT,
         native_unit_of_measurement=UnitOfMass.KILOGRAMS,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value=lambda data: get_state(data, BURNED_PELLETS_QUANTITY),
+        value=attrgetter("burned_pellets"),
+    ),
+)
+
+
+@dataclass
+class TorchPelletSystemDerivedSensorEntityDescription(SensorEntityDescription):
+    """Class to describe a sensor derived from the Torch Pellet System readings.
+
+    The key of the description is the key of the statistic it shows.
+    """
+
+
+# Sensors of the known variables, indexed by variable id
+SENSOR_REGISTRY: dict[str, TorchPelletSystemSensorEntityDescription] = {
+    description.key: description for description in SENSOR_TYPES
+}
+
+
+def _discovered_sensor_description(key: str) -> SensorEntityDescription:
+    """Describe the sensor of a numeric variable without a dedicated sensor."""
+
+    return SensorEntityDescription(
+        key=key,
+        name=f"Variable {key}",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+
+
+DERIVED_SENSOR_TYPES: tuple[TorchPelletSystemDerivedSensorEntityDescription, ...] = (
+    TorchPelletSystemDerivedSensorEntityDescription(
+        key=PELLET_CONSUMPTION_RATE_KEY,
+        name="Pellet Consumption Rate",
+        native_unit_of_measurement=f"{UnitOfMass.KILOGRAMS}/{UnitOfTime.HOURS}",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    TorchPelletSystemDerivedSensorEntityDescription(
+        key=BURN_DUTY_CYCLE_KEY,
+        name="Burn Duty Cycle",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    TorchPelletSystemDerivedSensorEntityDescription(
+        key=TEMPERATURE_DELTA_KEY,
+        name="Water Temperature Difference",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    TorchPelletSystemDerivedSensorEntityDescription(
+        key=THERMAL_EFFICIENCY_KEY,
+        name="Estimated Thermal Efficiency",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+
+def _get_data_metric(metrics: TorchApiMetrics, name: str) -> StateType:
+    """Return a metric of the requests for the pellet system readings."""
+
+    if (endpoint_metrics := metrics.endpoints.get(GET_DATA_ENDPOINT)) is None:
+        return None
+
+    return getattr(endpoint_metrics, name)
+
+
+def _get_data_latency(metrics: TorchApiMetrics) -> StateType:
+    """Return the duration of the last request for the readings, in ms."""
+
+    if (latency := _get_data_metric(metrics, "last_latency")) is None:
+        return None
+
+    return round(latency * 1000)
+
+
+@dataclass
+class TorchPelletSystemDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Class to describe a sensor showing metrics of the Torch cloud requests."""
+
+    value: Callable[[TorchApiMetrics], StateType] = lambda val: val
+
+
+DIAGNOSTIC_SENSOR_TYPES: tuple[
+    TorchPelletSystemDiagnosticSensorEntityDescription, ...
+] = (
+    TorchPelletSystemDiagnosticSensorEntityDescription(
+        key=REQUEST_LATENCY_KEY,
+        name="Cloud Request Latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=_get_data_latency,
+    ),
+    TorchPelletSystemDiagnosticSensorEntityDescription(
+        key=PAYLOAD_SIZE_KEY,
+        name="Cloud Payload Size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda metrics: _get_data_metric(metrics, "last_received_bytes"),
+    ),
+    TorchPelletSystemDiagnosticSensorEntityDescription(
+        key=REQUEST_ERRORS_KEY,
+        name="Cloud Request Errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=attrgetter("errors"),
+    ),
+    TorchPelletSystemDiagnosticSensorEntityDescription(
+        key=LOGINS_KEY,
+        name="Cloud Logins",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=attrgetter("logins"),
+    ),
+    TorchPelletSystemDiagnosticSensorEntityDescription(
+        key=CONNECTIONS_CREATED_KEY,
+        name="Cloud TLS Handshakes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=attrgetter("connections_created"),
     ),
 )
 
@@ -141,9 +229,30 @@ async def async_setup_entry(
 ) -> None:
     """Set up Torch Pellet System sensors."""
 
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
     async_add_entities(
-        TorchPelletSystemSensor(hass.data[DOMAIN][entry.entry_id], description)
-        for description in SENSOR_TYPES
+        [
+            *(
+                TorchPelletSystemSensor(coordinator, description)
+                for key in sorted(coordinator.variable_keys)
+                if (description := SENSOR_REGISTRY.get(key)) is not None
+            ),
+            *(
+                TorchPelletSystemDiscoveredSensor(
+                    coordinator, _discovered_sensor_description(key)
+                )
+                for key in sorted(coordinator.reading_keys)
+            ),
+            *(
+                TorchPelletSystemDerivedSensor(coordinator, description)
+                for description in DERIVED_SENSOR_TYPES
+            ),
+            *(
+                TorchPelletSystemDiagnosticSensor(coordinator, description)
+                for description in DIAGNOSTIC_SENSOR_TYPES
+            ),
+        ]
     )
 
 
@@ -159,7 +268,57 @@ class TorchPelletSystemSensor(TorchPelletSystemEntity, SensorEntity):
     ) -> None:
         """Initialize the sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+
+        return self.entity_description.value(self.coordinator.data)
+
+
+class TorchPelletSystemDiscoveredSensor(TorchPelletSystemSensor):
+    """Representation of a sensor of a discovered Torch Pellet System variable."""
+
+    entity_description: SensorEntityDescription
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+
+        return self.coordinator.data.readings[self.entity_description.key]
+
+
+class TorchPelletSystemDerivedSensor(TorchPelletSystemSensor):
+    """Representation of a sensor derived from the Torch Pellet System readings."""
+
+    entity_description: TorchPelletSystemDerivedSensorEntityDescription
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+
+        return self.coordinator.statistics.values[self.entity_description.key]
+
+
+class TorchPelletSystemDiagnosticSensor(TorchPelletSystemEntity, SensorEntity):
+    """Representation of a sensor showing metrics of the Torch cloud requests."""
+
+    entity_description: TorchPelletSystemDiagnosticSensorEntityDescription
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: TorchPelletSystemDataUpdateCoordinator,
+        description: TorchPelletSystemDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+
+        super().__init__(coordinator, METRICS_CONTEXT)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
 
@@ -167,4 +326,4 @@ class TorchPelletSystemSensor(TorchPelletSystemEntity, SensorEntity):
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
 
-        return self.entity_description.value(self.coordinator.data[Platform.SENSOR])
\ No newline at end of file
+        return self.entity_description.value(self.coordinator.api.metrics)
@@ -0,0 +1,139 @@
+"""Services of the Torch Pellet System integration."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import CONF_PATH, STATE_OFF, STATE_ON
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+from .coordinator import TorchPelletSystemDataUpdateCoordinator
+from .replay import async_replay
+from .torch_api import TorchApiError
+
+SERVICE_SET_STATE = "set_state"
+SERVICE_REPLAY = "replay"
+
+ATTR_STATE = "state"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_SPEED = "speed"
+
+# Burners switched at the same time by one service call
+MAX_PARALLEL_COMMANDS = 4
+
+SET_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_STATE): vol.In([STATE_ON, STATE_OFF]),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+REPLAY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(CONF_PATH): cv.string,
+        vol.Optional(ATTR_SPEED, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+
+async def _async_set_burner_state(
+    coordinator: TorchPelletSystemDataUpdateCoordinator | None,
+    turn_on: bool,
+    semaphore: asyncio.Semaphore,
+) -> dict[str, Any]:
+    """Switch the burner of one entry and return the result."""
+
+    if coordinator is None:
+        return {"success": False, "error": "Not a loaded Torch Pellet System entry"}
+
+    async with semaphore:
+        try:
+            confirmed = await coordinator.burner_commands.async_set_burner_on(turn_on)
+        except TorchApiError as error:
+            return {"success": False, "error": str(error)}
+
+    return {
+        "success": confirmed,
+        "state": coordinator.data.pellet_system_state if coordinator.data else None,
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_set_state(call: ServiceCall) -> ServiceResponse:
+        """Switch the burners of several entries on or off.
+
+        Without entries, every loaded burner is switched. The commands are
+        sent concurrently, a few at a time, and the result of each entry is
+        returned.
+        """
+
+        coordinators: dict[str, TorchPelletSystemDataUpdateCoordinator] = (
+            hass.data.get(DOMAIN, {})
+        )
+        entry_ids = call.data.get(ATTR_CONFIG_ENTRY_ID) or list(coordinators)
+        turn_on = call.data[ATTR_STATE] == STATE_ON
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_COMMANDS)
+
+        results = await asyncio.gather(
+            *(
+                _async_set_burner_state(
+                    coordinators.get(entry_id), turn_on, semaphore
+                )
+                for entry_id in entry_ids
+            )
+        )
+
+        return {"results": dict(zip(entry_ids, results))}
+
+    async def async_replay_export(call: ServiceCall) -> ServiceResponse:
+        """Replay a telemetry export file through a loaded entry."""
+
+        coordinator: TorchPelletSystemDataUpdateCoordinator | None = hass.data.get(
+            DOMAIN, {}
+        ).get(call.data[ATTR_CONFIG_ENTRY_ID])
+
+        if coordinator is None:
+            raise HomeAssistantError("Not a loaded Torch Pellet System entry")
+
+        path = hass.config.path(call.data[CONF_PATH])
+
+        if not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Access to {path} is not allowed")
+
+        try:
+            return await async_replay(hass, coordinator, path, call.data[ATTR_SPEED])
+        except OSError as error:
+            raise HomeAssistantError(f"Replaying {path} failed: {error}") from error
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY,
+        async_replay_export,
+        schema=REPLAY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_STATE,
+        async_set_state,
+        schema=SET_STATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
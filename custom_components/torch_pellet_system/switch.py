@@ -5,13 +5,14 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_platform
 
 from . import TorchPelletSystemEntity
 from .const import *
 from .coordinator import TorchPelletSystemDataUpdateCoordinator
+from .torch_api import TorchApiError
 
 
 async def async_setup_entry(
@@ -38,32 +39,49 @@ class TorchPelletSystemSwitch(TorchPelletSystemEntity, SwitchEntity):
     ) -> None:
         """Initialize the Torch Pellet System switch."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, PELLET_SYSTEM_STATE_KEY)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_enabled"
         self._attr_name = switch_name
+        self._optimistic_is_on: bool | None = None
 
-    def turn_on(self, **kwargs: Any) -> None:
+    async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the Torch Pellet System on."""
 
-        self.coordinator.api.turn_burner_on()
+        await self._async_set_burner_on(True)
 
-    def turn_off(self, **kwargs: Any) -> None:
+    async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the Torch Pellet System off."""
 
-        self.coordinator.api.turn_burner_off()
+        await self._async_set_burner_on(False)
+
+    async def _async_set_burner_on(self, turn_on: bool) -> None:
+        """Show the requested state right away until the burner confirms it.
+
+        Once the command is confirmed or rejected, the switch shows the
+        burner state again, which rolls back a rejected command.
+        """
+
+        self._optimistic_is_on = turn_on
+        self.async_write_ha_state()
+
+        try:
+            await self.coordinator.burner_commands.async_set_burner_on(turn_on)
+        except TorchApiError as error:
+            raise HomeAssistantError(
+                f"Switching the pellet burner failed: {error}"
+            ) from error
+        finally:
+            self._optimistic_is_on = None
+            self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
         """Return state of the Torch Pellet System switch."""
 
+        if self._optimistic_is_on is not None:
+            return self._optimistic_is_on
+
         if self.coordinator.data:
-            pellet_system_state = self.coordinator.data[Platform.SWITCH][
-                PELLET_SYSTEM_STATE_KEY
-            ]
-
-            if pellet_system_state == "0" or pellet_system_state == "4":
-                return False
-            else:
-                return True
+            return self.coordinator.data.is_burner_on
 
         return False
@@ -1,17 +1,480 @@
-import http.client
-from codecs import encode
+import asyncio
+import bisect
+from collections.abc import Awaitable, Callable, Mapping
 import json
-import datetime
-import requests
-import ssl
+import logging
+import random
+import time
 
-class TorchApi:
-    """An API client to work with the Torch Web System"""
-    ssl._create_default_https_context = ssl._create_unverified_context
+import aiohttp
 
-    SESSION_COOKIE_HEADER_VALUE = ""
+_LOGGER = logging.getLogger(__name__)
 
-    SESSION_EXPIRATION_DATE = datetime.datetime.now() - datetime.timedelta(days=1)
+
+def parse_data_payload(body: bytes, keys=None) -> dict[str, str]:
+    """Parse the variable readings out of a get_data response body
+
+    Decoding starts at the first "{" of the body through a memoryview, so the
+    non-JSON prefix sent by the Torch Web Interface is skipped without
+    copying the body. It also keeps a non-ASCII prefix from widening the
+    decoded document. The whole document is decoded; when keys are given,
+    only the variables with those ids are kept in the result.
+    """
+
+    json_start = body.index(b"{")
+
+    parsed_data = json.loads(str(memoryview(body)[json_start:], "utf-8"))
+
+    if keys is None:
+        return {item["id"]: item["value"] for item in parsed_data["vars"]}
+
+    return {
+        item["id"]: item["value"]
+        for item in parsed_data["vars"]
+        if item["id"] in keys
+    }
+
+
+class TorchApiError(Exception):
+    """Error to indicate the Torch Web Interface request failed"""
+
+
+class TorchAuthenticationError(TorchApiError):
+    """Error to indicate the Torch Web Interface rejected the credentials"""
+
+
+class TorchConnectionError(TorchApiError):
+    """Error to indicate the Torch Web Interface could not be reached"""
+
+
+class TorchCircuitOpenError(TorchApiError):
+    """Error to indicate requests are held back during a Torch outage"""
+
+
+class TorchCircuitBreaker:
+    """Stops sending requests to the Torch Web Interface during an outage
+
+    After a number of consecutive failed requests the circuit opens and
+    requests fail right away. Once the cooldown has passed, a single request
+    is let through. Its success closes the circuit again and its failure
+    keeps it open for another cooldown.
+    """
+
+    FAILURE_THRESHOLD = 3
+
+    COOLDOWN = 5 * 60
+
+    def __init__(self) -> None:
+        """Initialize a closed circuit"""
+
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether requests are currently held back"""
+
+        return (
+            self._opened_at is not None
+            and time.monotonic() < self._opened_at + self.COOLDOWN
+        )
+
+    def raise_if_open(self) -> None:
+        """Raise when requests are currently held back"""
+
+        if self.is_open:
+            raise TorchCircuitOpenError(
+                "Requests to the Torch Web Interface are paused after "
+                f"{self._failures} consecutive failures"
+            )
+
+        if self._opened_at is not None:
+            # Let the next request probe whether the outage is over.
+            self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request"""
+
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold"""
+
+        self._failures += 1
+
+        if self._failures >= self.FAILURE_THRESHOLD:
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "Pausing requests to the Torch Web Interface for %s seconds",
+                    self.COOLDOWN,
+                )
+
+            self._opened_at = time.monotonic()
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return the delay before a retry, exponential with full jitter"""
+
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2**attempt))
+
+
+class TorchEndpointMetrics:
+    """Timings and counters of the requests sent to one endpoint"""
+
+    LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "latency_histogram",
+        "total_latency",
+        "last_latency",
+        "received_bytes",
+        "last_received_bytes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the metrics without any requests"""
+
+        self.requests = 0
+        self.errors = 0
+        # The last bucket counts the requests slower than all bounds.
+        self.latency_histogram = [0] * (len(self.LATENCY_BUCKETS) + 1)
+        self.total_latency = 0.0
+        self.last_latency: float | None = None
+        self.received_bytes = 0
+        self.last_received_bytes: int | None = None
+
+    def record(self, latency: float, received_bytes: int, failed: bool) -> None:
+        """Record one request"""
+
+        self.requests += 1
+        self.errors += failed
+        bucket = bisect.bisect_left(self.LATENCY_BUCKETS, latency)
+
+        self.latency_histogram[bucket] += 1
+        self.total_latency += latency
+        self.last_latency = latency
+        self.received_bytes += received_bytes
+        self.last_received_bytes = received_bytes
+
+    def as_dict(self) -> dict:
+        """Return the metrics as a dictionary"""
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_histogram": dict(
+                zip(
+                    [f"<={bound}s" for bound in self.LATENCY_BUCKETS] + ["slower"],
+                    self.latency_histogram,
+                )
+            ),
+            "average_latency": self.total_latency / self.requests
+            if self.requests
+            else None,
+            "last_latency": self.last_latency,
+            "received_bytes": self.received_bytes,
+            "last_received_bytes": self.last_received_bytes,
+        }
+
+
+class TorchApiMetrics:
+    """Instrumentation of the requests sent by an API client"""
+
+    def __init__(self) -> None:
+        """Initialize the metrics without any requests"""
+
+        self.endpoints: dict[str, TorchEndpointMetrics] = {}
+        self.logins = 0
+        self.connections_created = 0
+
+    @property
+    def errors(self) -> int:
+        """Return the failed requests of all endpoints"""
+
+        return sum(endpoint.errors for endpoint in self.endpoints.values())
+
+    def record(
+        self, endpoint: str, latency: float, received_bytes: int, failed: bool
+    ) -> None:
+        """Record one request sent to an endpoint"""
+
+        if (endpoint_metrics := self.endpoints.get(endpoint)) is None:
+            endpoint_metrics = self.endpoints[endpoint] = TorchEndpointMetrics()
+
+        endpoint_metrics.record(latency, received_bytes, failed)
+
+    def as_dict(self) -> dict:
+        """Return the metrics as a dictionary"""
+
+        return {
+            "logins": self.logins,
+            "connections_created": self.connections_created,
+            "endpoints": {
+                endpoint: endpoint_metrics.as_dict()
+                for endpoint, endpoint_metrics in self.endpoints.items()
+            },
+        }
+
+
+async def _on_connection_create_end(session, trace_config_ctx, params) -> None:
+    """Count a new connection, and therefore TLS handshake, of an API client"""
+
+    if isinstance(metrics := trace_config_ctx.trace_request_ctx, TorchApiMetrics):
+        metrics.connections_created += 1
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Return the trace config that counts the connections of API clients
+
+    It has to be passed to the aiohttp session the clients share.
+    """
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+
+    return trace_config
+
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Bounds of every request, so a hung endpoint cannot hold up a caller
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_read=10)
+LOGIN_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_read=20)
+
+# Attempts of idempotent requests failing with transient errors
+REQUEST_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_CAP = 8.0
+
+# Seconds rejected credentials are not sent again, doubling on every rejection
+AUTH_BACKOFF_BASE = 60.0
+AUTH_BACKOFF_CAP = 3600.0
+
+
+def _is_session_gone(status, body, expect_json) -> bool:
+    """Tell whether a response shows that the Torch session has expired
+
+    An expired session is answered with a redirect to the login page or with
+    the login page itself instead of the expected JSON document.
+    """
+
+    if status in _REDIRECT_STATUSES:
+        return True
+
+    if not expect_json or status == 304:
+        return False
+
+    json_start = body.find(b"{")
+
+    if json_start == -1:
+        return True
+
+    prefix = body[:json_start].lower()
+
+    return b"<html" in prefix or b"<!doctype" in prefix
+
+
+def _conditional_request_headers(response_headers: Mapping[str, str]) -> dict[str, str]:
+    """Return the conditional request headers matching a response"""
+
+    validators = {}
+
+    if etag := response_headers.get("ETag"):
+        validators["If-None-Match"] = etag
+
+    if last_modified := response_headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+
+    return validators
+
+
+_BURNER_COMMAND_BOUNDARY = "wL36Yn8afVp8Ag7AmP8qZ0SA4n1v9T"
+
+_BURNER_COMMAND_HEADERS = {
+    "X-Requested-With": "XMLHttpRequest",
+    "Content-type": "multipart/form-data; boundary={}".format(
+        _BURNER_COMMAND_BOUNDARY
+    ),
+}
+
+
+def _burner_command_payload(status: str) -> bytes:
+    """Encode the multipart form of a burner command"""
+
+    data_list = [
+        "--" + _BURNER_COMMAND_BOUNDARY,
+        "Content-Disposition: form-data; name=goto;",
+        "Content-Type: {}".format("text/plain"),
+        "",
+        status,
+        "--" + _BURNER_COMMAND_BOUNDARY + "--",
+        "",
+    ]
+
+    return "\r\n".join(data_list).encode()
+
+
+# The forms of the commands are encoded once instead of on every command
+_BURNER_COMMAND_PAYLOADS = {
+    status: _burner_command_payload(status) for status in ("on", "off")
+}
+
+
+class TorchSessionManager:
+    """Keeps a Torch Web Interface session logged in
+
+    The session is renewed in the background shortly before it expires, so
+    callers normally get a valid cookie without any extra round-trips. When a
+    renewal is needed on demand, all concurrent callers wait for the same
+    in-flight renewal instead of logging in once each.
+    """
+
+    SESSION_LIFETIME = 30 * 60
+
+    RENEWAL_MARGIN = 5 * 60
+
+    def __init__(self, authenticate: Callable[[], Awaitable[str]]) -> None:
+        """Initialize the session manager with a coroutine that logs in"""
+
+        self._authenticate = authenticate
+        self._session_cookie = ""
+        self._expires_at = 0.0
+        self._renewal: asyncio.Task | None = None
+        self._renewal_timer: asyncio.TimerHandle | None = None
+
+        self.on_renewed: Callable[[], None] | None = None
+
+    @property
+    def session_cookie(self) -> str:
+        """Return the cookie of the current session"""
+
+        return self._session_cookie
+
+    @property
+    def expires_at(self) -> float:
+        """Return the UNIX timestamp the current session expires at"""
+
+        return self._expires_at
+
+    @property
+    def is_valid(self) -> bool:
+        """Return whether the current session has not expired yet"""
+
+        return bool(self._session_cookie) and time.time() < self._expires_at
+
+    def restore(self, session_cookie: str, expires_at: float) -> None:
+        """Reuse a session that was logged in before, unless it has expired"""
+
+        if self.is_valid or expires_at <= time.time():
+            return
+
+        self._session_cookie = session_cookie
+        self._expires_at = expires_at
+        self._schedule_renewal()
+
+    async def async_get_session_cookie(self) -> str:
+        """Return the cookie of a valid session, logging in if needed"""
+
+        if self.is_valid:
+            return self._session_cookie
+
+        return await self.async_renew()
+
+    async def async_renew(self) -> str:
+        """Renew the session, joining a renewal that is already in flight"""
+
+        if self._renewal is None:
+            self._renewal = asyncio.create_task(self._async_renew())
+
+        # Shielded, so a cancelled caller does not abort the renewal the
+        # other callers are waiting for.
+        return await asyncio.shield(self._renewal)
+
+    async def async_renew_expired(self, session_cookie: str) -> str:
+        """Renew a session the Torch Web Interface reported as gone
+
+        Callers pass the cookie they were rejected with. If another caller
+        has already replaced it, the new session is reused as is.
+        """
+
+        if self._renewal is None and session_cookie != self._session_cookie:
+            return await self.async_get_session_cookie()
+
+        return await self.async_renew()
+
+    def invalidate(self) -> None:
+        """Drop the current session, so the next caller logs in again"""
+
+        self.close()
+        self._session_cookie = ""
+        self._expires_at = 0.0
+
+    def close(self) -> None:
+        """Stop the background renewal"""
+
+        if self._renewal_timer is not None:
+            self._renewal_timer.cancel()
+            self._renewal_timer = None
+
+        if self._renewal is not None:
+            self._renewal.cancel()
+            self._renewal = None
+
+    async def _async_renew(self) -> str:
+        """Log in with a new session and schedule its background renewal"""
+
+        try:
+            session_cookie = await self._authenticate()
+        finally:
+            self._renewal = None
+
+        self._session_cookie = session_cookie
+        self._expires_at = time.time() + self.SESSION_LIFETIME
+        self._schedule_renewal()
+
+        if self.on_renewed is not None:
+            self.on_renewed()
+
+        return session_cookie
+
+    def _schedule_renewal(self) -> None:
+        """Schedule the renewal of the current session before it expires"""
+
+        if self._renewal_timer is not None:
+            self._renewal_timer.cancel()
+
+        self._renewal_timer = asyncio.get_running_loop().call_later(
+            max(self._expires_at - self.RENEWAL_MARGIN - time.time(), 0),
+            self._renew_in_background,
+        )
+
+    def _renew_in_background(self) -> None:
+        """Start a background renewal of the current session"""
+
+        self._renewal_timer = None
+
+        if self._renewal is None:
+            self._renewal = asyncio.create_task(self._async_renew())
+            self._renewal.add_done_callback(self._background_renewal_done)
+
+    @staticmethod
+    def _background_renewal_done(renewal: asyncio.Task) -> None:
+        """Log a failed background renewal, the next caller retries it"""
+
+        if not renewal.cancelled() and (error := renewal.exception()) is not None:
+            _LOGGER.warning("Renewing the Torch session failed: %s", error)
+
+
+class AsyncTorchApi:
+    """An asyncio API client to work with the Torch Web System
+
+    All requests share the keep-alive connection pool of the aiohttp session
+    handed in by the caller, so consecutive polls reuse the same TLS
+    connection to the Torch Web Interface instead of handshaking every time.
+    """
 
     TORCH_AUTHENTICATION_RESULT = {
         "InvalidCredentials": "Invalid Credentials",
@@ -21,37 +484,100 @@ class TorchApi:
 
     TORCH_WEB_INTERFACE_BASE_URL = "my.torch-burner.eu"
 
-    CREDENTIALS_USERNAME = ""
-    CREDENTIALS_PASSWORD = ""
+    def __init__(
+        self, session: aiohttp.ClientSession, username, password, base_url=None
+    ):
+        """Initialize the API Module with an HTTP session and credentials
 
-    def get_new_session_id(self) -> None:
-        """Getting a new session id from the Torch Web Insterface"""
-        ssl._create_default_https_context = ssl._create_unverified_context
+        The base URL defaults to the Torch Web Interface. Pointing it to a
+        local stand-in server allows exercising the client offline.
+        """
+
+        self._session = session
+        self._base_url = base_url or "https://" + self.TORCH_WEB_INTERFACE_BASE_URL
+
+        self.CREDENTIALS_USERNAME = username
+        self.CREDENTIALS_PASSWORD = password
+
+        self.session_manager = TorchSessionManager(self._async_authenticate)
+        self.circuit_breaker = TorchCircuitBreaker()
+
+        # Rejected credentials are not sent again until the backoff has passed
+        self._rejected_logins = 0
+        self._login_blocked_until = 0.0
+        self.metrics = TorchApiMetrics()
+
+        # Seconds a get_data response is served again to later readers, set
+        # by the coordinator from the options; nothing is cached until then
+        self.data_cache_ttl = 0.0
+        self._data_cache: tuple[float, bytes] | None = None
+        self._data_request: asyncio.Task[bytes] | None = None
+        self._data_generation = 0
 
-        http_connection = http.client.HTTPSConnection(self.TORCH_WEB_INTERFACE_BASE_URL, context = ssl._create_unverified_context())
-        http_connection.request("GET", "/user/", "", {})
-        response = http_connection.getresponse()
-        set_cookie_header_value = response.headers.get("Set-Cookie")
+        # Validators of the last full get_data response, sent back to have
+        # the server answer 304 Not Modified while the data is unchanged
+        self._data_validators: dict[str, str] = {}
+        self._data_body: bytes | None = None
+        self.data_version = 0
+        self.supports_conditional_requests: bool | None = None
 
-        self.SESSION_COOKIE_HEADER_VALUE = set_cookie_header_value[
-            0 : set_cookie_header_value.index(";")
-        ]
+    def close(self) -> None:
+        """Stop keeping the Torch session alive
+
+        The HTTP session belongs to the caller and is left open.
+        """
+
+        self.session_manager.close()
+
+    def update_credentials(self, username, password) -> None:
+        """Switch to new credentials without recreating the client
+
+        The session and the data of the old credentials are dropped and the
+        backoff of rejected logins is reset. The connections are kept.
+        """
+
+        self.CREDENTIALS_USERNAME = username
+        self.CREDENTIALS_PASSWORD = password
+
+        self._rejected_logins = 0
+        self._login_blocked_until = 0.0
+        self.session_manager.invalidate()
+        self._invalidate_data()
+        self._data_validators = {}
+        self._data_body = None
+
+    async def get_new_session_id(self) -> str:
+        """Getting a new session id from the Torch Web Insterface"""
 
-        self.SESSION_EXPIRATION_DATE = datetime.datetime.now() + datetime.timedelta(
-            minutes=30
+        started = time.monotonic()
+
+        try:
+            async with self._session.get(
+                self._base_url + "/user/",
+                allow_redirects=False,
+                timeout=REQUEST_TIMEOUT,
+                trace_request_ctx=self.metrics,
+            ) as response:
+                set_cookie_header_value = response.headers.get("Set-Cookie")
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.metrics.record("/user/", time.monotonic() - started, 0, True)
+            raise
+
+        self.metrics.record(
+            "/user/",
+            time.monotonic() - started,
+            len(body),
+            not set_cookie_header_value,
         )
 
-    def ensure_valid_session(self):
-        """Ensuring a valid session id from the Torch Web Insterface is present"""
-        ssl._create_default_https_context = ssl._create_unverified_context
+        if not set_cookie_header_value:
+            raise TorchApiError("The Torch Web Interface did not open a session")
 
-        if self.SESSION_EXPIRATION_DATE < datetime.datetime.now():
-            self.get_new_session_id()
-            self.login()
+        return set_cookie_header_value[0 : set_cookie_header_value.index(";")]
 
-    def login(self, username="", password=""):
+    async def login(self, username="", password="", session_cookie=None):
         """Login the user in the Torch Web Insterface"""
-        ssl._create_default_https_context = ssl._create_unverified_context
 
         if username == "":
             username = self.CREDENTIALS_USERNAME
@@ -59,120 +585,283 @@ class TorchApi:
         if password == "":
             password = self.CREDENTIALS_PASSWORD
 
+        if session_cookie is None:
+            session_cookie = self.session_manager.session_cookie
+
         payload = {"username": username, "password": password}
-        headers = {"Cookie": self.SESSION_COOKIE_HEADER_VALUE}
-
-        login_response = requests.request(
-            "POST",
-            "https://my.torch-burner.eu/",
-            headers=headers,
-            data=payload,
-            files=[],
-            timeout=120,
-            verify=False
+        headers = {"Cookie": session_cookie}
+
+        started = time.monotonic()
+
+        try:
+            async with self._session.post(
+                self._base_url + "/",
+                headers=headers,
+                data=payload,
+                timeout=LOGIN_TIMEOUT,
+                trace_request_ctx=self.metrics,
+            ) as login_response:
+                status = login_response.status
+                response_body = await login_response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.metrics.record("/", time.monotonic() - started, 0, True)
+            raise
+
+        self.metrics.record(
+            "/", time.monotonic() - started, len(response_body), status != 200
         )
 
-        if login_response.status_code == 200:
-            response_content = login_response.text
+        if status != 200:
+            return self.TORCH_AUTHENTICATION_RESULT["ServiceUnavailable"]
 
-            if (
-                response_content.find("Потребителското име и паролата несъвпадат!")
-                != -1
-            ):
-                return self.TORCH_AUTHENTICATION_RESULT["InvalidCredentials"]
+        response_content = response_body.decode("utf-8", "replace")
+
+        if response_content.find("Потребителското име и паролата несъвпадат!") != -1:
+            return self.TORCH_AUTHENTICATION_RESULT["InvalidCredentials"]
+
+        return self.TORCH_AUTHENTICATION_RESULT["LoginSucceeded"]
+
+    async def _async_authenticate(self) -> str:
+        """Open a new session and log it in, returning its cookie
+
+        Once the Torch Web Interface rejects the credentials, further logins
+        fail right away for a backoff doubling with every rejection, so bad
+        credentials do not keep hitting the cloud on every poll.
+        """
+
+        if time.monotonic() < self._login_blocked_until:
+            raise TorchAuthenticationError(
+                self.TORCH_AUTHENTICATION_RESULT["InvalidCredentials"]
+            )
+
+        try:
+            session_cookie = await self.get_new_session_id()
+
+            authentication_result = await self.login(session_cookie=session_cookie)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            raise TorchConnectionError(
+                f"Logging in to the Torch Web Interface failed: {error!r}"
+            ) from error
+
+        if (
+            authentication_result
+            == self.TORCH_AUTHENTICATION_RESULT["InvalidCredentials"]
+        ):
+            self._login_blocked_until = time.monotonic() + min(
+                AUTH_BACKOFF_CAP, AUTH_BACKOFF_BASE * 2**self._rejected_logins
+            )
+            self._rejected_logins += 1
+            raise TorchAuthenticationError(authentication_result)
+
+        if (
+            authentication_result
+            == self.TORCH_AUTHENTICATION_RESULT["ServiceUnavailable"]
+        ):
+            raise TorchConnectionError(authentication_result)
+
+        self.metrics.logins += 1
+        self._rejected_logins = 0
+
+        return session_cookie
+
+    async def _async_request(
+        self, method, path, headers, data=None, expect_json=False
+    ) -> tuple[int, bytes, Mapping[str, str]]:
+        """Send a request through the circuit breaker
+
+        Idempotent requests failing with a transient error are retried with
+        an exponential, jittered backoff. Commands are sent only once.
+        """
+
+        self.circuit_breaker.raise_if_open()
+
+        attempts = REQUEST_ATTEMPTS if method == "GET" else 1
+
+        for attempt in range(attempts):
+            if attempt:
+                await asyncio.sleep(_backoff_delay(attempt))
+
+            try:
+                response = await self._async_request_in_session(
+                    method, path, headers, data, expect_json
+                )
+            except TorchAuthenticationError:
+                raise
+            except TorchConnectionError as error:
+                _LOGGER.debug("Request to %s failed: %s", path, error)
+                last_error = error
+            except TorchApiError:
+                self.circuit_breaker.record_failure()
+                raise
             else:
-                return self.TORCH_AUTHENTICATION_RESULT["LoginSucceeded"]
-        else:
-            return self.TORCH_AUTHENTICATION_RESULT["ServiceUnavailable"]
+                self.circuit_breaker.record_success()
+                return response
+
+        self.circuit_breaker.record_failure()
+        raise last_error
+
+    async def _async_request_in_session(
+        self, method, path, headers, data, expect_json
+    ) -> tuple[int, bytes, Mapping[str, str]]:
+        """Send a request within the session, logging in again once if it is gone"""
+
+        session_cookie = await self.session_manager.async_get_session_cookie()
+
+        for attempt in range(2):
+            started = time.monotonic()
+
+            try:
+                async with self._session.request(
+                    method,
+                    self._base_url + path,
+                    headers={**headers, "Cookie": session_cookie},
+                    data=data,
+                    allow_redirects=False,
+                    timeout=REQUEST_TIMEOUT,
+                    trace_request_ctx=self.metrics,
+                ) as response:
+                    status = response.status
+                    response_headers = response.headers
+                    body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                self.metrics.record(path, time.monotonic() - started, 0, True)
+                raise TorchConnectionError(
+                    f"Request to {path} failed: {error!r}"
+                ) from error
+
+            self.metrics.record(
+                path, time.monotonic() - started, len(body), status >= 400
+            )
+
+            if status >= 500:
+                raise TorchConnectionError(f"Request to {path} returned {status}")
+
+            if attempt or not _is_session_gone(status, body, expect_json):
+                break
+
+            _LOGGER.debug("Torch session expired early, logging in again")
+            session_cookie = await self.session_manager.async_renew_expired(
+                session_cookie
+            )
+
+        return status, body, response_headers
+
+    async def set_burner_status(self, status):
+        """Switching the pellet burner on and off"""
 
-    def __init__(self, username, password):
-        """Initialize the API Module with credentials"""
-        ssl._create_default_https_context = ssl._create_unverified_context
+        payload = _BURNER_COMMAND_PAYLOADS.get(status) or _burner_command_payload(
+            status
+        )
 
-        self.CREDENTIALS_USERNAME = username
-        self.CREDENTIALS_PASSWORD = password
+        try:
+            response_status, _, _ = await self._async_request(
+                "POST", "/user/ajax/burner_onoff", _BURNER_COMMAND_HEADERS, payload
+            )
+        finally:
+            self._invalidate_data()
 
-        self.ensure_valid_session()
+        return response_status
 
-    def set_burner_status(self, status):
-        """Switching the pellet burner on and off"""
-        ssl._create_default_https_context = ssl._create_unverified_context
+    async def turn_burner_on(self):
+        """Turn on the Pellet Burner"""
 
-        self.ensure_valid_session()
+        return await self.set_burner_status("on")
 
-        http_connection = http.client.HTTPSConnection(self.TORCH_WEB_INTERFACE_BASE_URL, context = ssl._create_unverified_context())
+    async def turn_burner_off(self):
+        """Turn off the Pellet Burner"""
 
-        data_list = []
+        return await self.set_burner_status("off")
 
-        boundary = "wL36Yn8afVp8Ag7AmP8qZ0SA4n1v9T"
+    async def get_data(self, keys=None):
+        """Get your Torch Pellet System current data readings
 
-        data_list.append(encode("--" + boundary))
-        data_list.append(encode("Content-Disposition: form-data; name=goto;"))
+        When keys are given, only the variables with those ids are returned.
+        Concurrent readers share one request, and a response younger than
+        data_cache_ttl seconds is served again without a request.
+        """
 
-        data_list.append(encode("Content-Type: {}".format("text/plain")))
-        data_list.append(encode(""))
+        response_body = await self._async_get_data_body()
 
-        data_list.append(encode(status))
-        data_list.append(encode("--" + boundary + "--"))
-        data_list.append(encode(""))
+        return self._parse_data(response_body, keys)
 
-        payload = b"\r\n".join(data_list)
+    async def get_data_if_changed(self, known_version=None, keys=None):
+        """Get the current data readings unless they are already known
 
-        headers = {
-            "Cookie": self.SESSION_COOKIE_HEADER_VALUE,
-            "X-Requested-With": "XMLHttpRequest",
-            "Content-type": "multipart/form-data; boundary={}".format(boundary),
-        }
+        Returns the version of the data and the readings, or None in place
+        of the readings when the data has the known version. Unchanged data
+        is detected through conditional requests, where the server supports
+        them, and is not parsed again.
+        """
 
-        http_connection.request("POST", "/user/ajax/burner_onoff", payload, headers)
+        response_body = await self._async_get_data_body()
 
-        status_set_response = http_connection.getresponse()
+        if self.data_version == known_version:
+            return self.data_version, None
 
-        print(status_set_response.status)
+        return self.data_version, self._parse_data(response_body, keys)
 
-    def turn_burner_on(self):
-        """Turn on the Pellet Burner"""
-        ssl._create_default_https_context = ssl._create_unverified_context
+    @staticmethod
+    def _parse_data(response_body, keys):
+        """Parse a get_data response body"""
 
-        self.set_burner_status("on")
+        try:
+            return parse_data_payload(response_body, keys)
+        except (ValueError, KeyError, TypeError) as error:
+            raise TorchApiError(
+                f"Unexpected get_data response: {error!r}"
+            ) from error
 
-    def turn_burner_off(self):
-        """Turn off the Pellet Burner"""
-        ssl._create_default_https_context = ssl._create_unverified_context
+    async def _async_get_data_body(self) -> bytes:
+        """Return a fresh get_data response body, joining a request in flight"""
+
+        if (
+            self._data_cache is not None
+            and time.monotonic() - self._data_cache[0] < self.data_cache_ttl
+        ):
+            return self._data_cache[1]
 
-        self.set_burner_status("off")
+        if self._data_request is None:
+            self._data_request = asyncio.create_task(self._async_fetch_data_body())
 
-    def get_data(self):
-        """Get your Torch Pellet System current data readings"""
-        ssl._create_default_https_context = ssl._create_unverified_context
+        return await asyncio.shield(self._data_request)
 
-        self.ensure_valid_session()
+    async def _async_fetch_data_body(self) -> bytes:
+        """Request the get_data response body and cache it"""
 
-        http_connection = http.client.HTTPSConnection(self.TORCH_WEB_INTERFACE_BASE_URL, context = ssl._create_unverified_context())
+        data_generation = self._data_generation
 
         headers = {
-            "Cookie": self.SESSION_COOKIE_HEADER_VALUE,
             "Accept": "*/*",
-            "Referer": "https://my.torch-burner.eu/user/",
+            "Referer": self._base_url + "/user/",
             "X-Requested-With": "XMLHttpRequest",
+            **self._data_validators,
         }
 
-        http_connection.request("GET", "/user/ajax/get_data", "", headers)
-
-        response = http_connection.getresponse()
-        response_content = response.read().decode("utf-8")
+        try:
+            status, response_body, response_headers = await self._async_request(
+                "GET", "/user/ajax/get_data", headers, expect_json=True
+            )
+        finally:
+            if self._data_request is asyncio.current_task():
+                self._data_request = None
 
-        sanitized_response_content = response_content[
-            response_content.index("{") : len(response_content)
-        ]
-
-        parsedData = json.loads(sanitized_response_content)
+        if status == 304 and self._data_body is not None:
+            response_body = self._data_body
+        else:
+            self._data_body = response_body
+            self._data_validators = _conditional_request_headers(response_headers)
+            self.supports_conditional_requests = bool(self._data_validators)
+            self.data_version += 1
 
-        systemData = parsedData["vars"]
+        # A command sent meanwhile may have changed the data already.
+        if data_generation == self._data_generation:
+            self._data_cache = (time.monotonic(), response_body)
 
-        dataToReturn = {}
+        return response_body
 
-        for dataItem in systemData:
-            dataToReturn[dataItem["id"]] = dataItem["value"]
+    def _invalidate_data(self) -> None:
+        """Stop serving the data read before a command to later readers"""
 
-        return dataToReturn
+        self._data_generation += 1
+        self._data_cache = None
+        self._data_request = None
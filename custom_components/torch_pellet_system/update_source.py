@@ -0,0 +1,168 @@
+"""Sources of the Torch Pellet System data for the update coordinator."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime
+from itertools import islice
+from typing import TextIO
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .exporter import decode_line
+from .torch_api import AsyncTorchApi
+
+
+class TorchUpdateSource(ABC):
+    """Where the coordinator gets the variables of the pellet system from."""
+
+    name: str
+
+    # Whether the source replays recorded data instead of the live system
+    recorded = False
+
+    def now(self) -> datetime:
+        """Return the time of the data fetched last."""
+
+        return dt_util.utcnow()
+
+    @property
+    def is_supported(self) -> bool:
+        """Return whether the source works with the Torch Web Interface."""
+
+        return True
+
+    @abstractmethod
+    async def async_fetch(self) -> Mapping[str, str] | None:
+        """Return the current variables, or None when they did not change."""
+
+
+class TorchPollingSource(TorchUpdateSource):
+    """Request the full data on every update."""
+
+    name = "polling"
+
+    def __init__(self, api: AsyncTorchApi) -> None:
+        """Initialize the source."""
+
+        self._api = api
+
+    async def async_fetch(self) -> Mapping[str, str] | None:
+        """Return the current variables."""
+
+        return await self._api.get_data()
+
+
+class TorchConditionalSource(TorchUpdateSource):
+    """Revalidate the data with conditional requests on every update.
+
+    While the data is unchanged the server answers 304 Not Modified, so the
+    update transfers and parses nothing. The source still sends a request
+    on every update and sees a change no sooner than polling does. The
+    source is not supported when the server sends no ETag or Last-Modified
+    validators.
+    """
+
+    name = "conditional"
+
+    def __init__(self, api: AsyncTorchApi) -> None:
+        """Initialize the source."""
+
+        self._api = api
+        self._known_version: int | None = None
+
+    @property
+    def is_supported(self) -> bool:
+        """Return whether the server sends validators for the data."""
+
+        return self._api.supports_conditional_requests is not False
+
+    async def async_fetch(self) -> Mapping[str, str] | None:
+        """Return the current variables, or None when they did not change."""
+
+        self._known_version, data = await self._api.get_data_if_changed(
+            self._known_version
+        )
+
+        return data
+
+
+class TorchReplaySource(TorchUpdateSource):
+    """Replay the polls recorded by the telemetry export.
+
+    Every update returns the next recorded poll, timestamped with the time it
+    was recorded at, so a runner can replay months of polls in minutes. The
+    file is read by the executor a batch of lines at a time.
+    """
+
+    name = "replay"
+    recorded = True
+
+    READ_BATCH_SIZE = 1000
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the source replaying the given export file."""
+
+        self._hass = hass
+        self._path = path
+        self._file: TextIO | None = None
+        self._end_of_file = False
+        self._records: deque[tuple[datetime, dict[str, str]]] = deque()
+        self._timestamp: datetime | None = None
+
+    @property
+    def next_timestamp(self) -> datetime | None:
+        """Return the time of the next buffered poll."""
+
+        return self._records[0][0] if self._records else None
+
+    def now(self) -> datetime:
+        """Return the time the last replayed poll was recorded at."""
+
+        return self._timestamp or dt_util.utcnow()
+
+    async def async_has_more(self) -> bool:
+        """Return whether polls are left, reading the next batch if needed."""
+
+        if not self._records and not self._end_of_file:
+            self._records.extend(
+                await self._hass.async_add_executor_job(self._read_batch)
+            )
+
+        return bool(self._records)
+
+    async def async_fetch(self) -> Mapping[str, str] | None:
+        """Return the variables of the next recorded poll."""
+
+        if not await self.async_has_more():
+            return None
+
+        self._timestamp, data = self._records.popleft()
+
+        return data
+
+    async def async_close(self) -> None:
+        """Close the export file."""
+
+        if self._file is not None:
+            await self._hass.async_add_executor_job(self._file.close)
+            self._file = None
+
+    def _read_batch(self) -> list[tuple[datetime, dict[str, str]]]:
+        """Read the next recorded polls, skipping foreign lines."""
+
+        if self._file is None:
+            self._file = open(self._path, encoding="utf-8")
+
+        records: list[tuple[datetime, dict[str, str]]] = []
+
+        while not records and not self._end_of_file:
+            lines = list(islice(self._file, self.READ_BATCH_SIZE))
+            self._end_of_file = len(lines) < self.READ_BATCH_SIZE
+            records.extend(
+                record for line in lines if (record := decode_line(line)) is not None
+            )
+
+        return records
@@ -0,0 +1,286 @@
+"""Benchmark the Torch client against the stand-in server.
+
+Polls get_data the way the coordinator does and reports the per-poll
+latency, the TLS handshakes (new connections) and logins per hour of polling
+and the memory used. Without a time scale the polls run back to back, so
+idle connections never time out between polls; a time scale of 60 waits a
+minute of the interval per second.
+
+The switch path follows: the burner is switched on and off, and the latency
+of the command and of the burner state refresh confirming it are reported.
+No executor thread time is measured, because neither path runs executor
+jobs anymore: requests, logins and the parsing all run on the event loop.
+
+With --compare-sources, the polling and the conditional update sources poll
+instead while the readings change at random times. The requests, bytes and
+staleness of each are reported. Both sources poll on the same schedule, so
+they send as many requests and see a change equally late. The client sends
+the validators of the last response for either source, so both transfer
+the same bytes too; the conditional source only skips parsing and
+publishing the data while nothing changed.
+
+Run from the repository root:
+
+    python -m scripts.benchmark --polls 500 --interval 60 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import resource
+import statistics
+import time
+import tracemalloc
+
+import aiohttp
+
+from custom_components.torch_pellet_system.const import (
+    PELLET_BURNER_TEMPERATURE_KEY,
+    PELLET_SYSTEM_STATE_KEY,
+)
+from custom_components.torch_pellet_system.torch_api import (
+    AsyncTorchApi,
+    TorchApiError,
+    create_trace_config,
+)
+from tests.stand_in import TorchStandInServer
+
+GET_DATA_PATH = "/user/ajax/get_data"
+
+def _percentile(values: list[float], share: float) -> float:
+    """Return the value the given share of the sorted values is below, in ms."""
+
+    return values[max(int(len(values) * share) - 1, 0)] * 1000
+
+
+async def async_switch(
+    api: AsyncTorchApi, commands: int
+) -> tuple[list[float], list[float]]:
+    """Switch the burner on and off and return the command and refresh times.
+
+    Every command is confirmed by fetching only the burner state, as the
+    coordinator does.
+    """
+
+    command_latencies: list[float] = []
+    refresh_latencies: list[float] = []
+
+    for index in range(commands):
+        turn_on = not index % 2
+
+        started = time.perf_counter()
+        try:
+            await (api.turn_burner_on() if turn_on else api.turn_burner_off())
+            command_latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await api.get_data((PELLET_SYSTEM_STATE_KEY,))
+            refresh_latencies.append(time.perf_counter() - started)
+        except TorchApiError:
+            pass
+
+    return sorted(command_latencies), sorted(refresh_latencies)
+
+
+async def async_benchmark(args: argparse.Namespace) -> dict[str, float]:
+    """Poll the stand-in server and return the measurements."""
+
+    server = TorchStandInServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        session_lifetime=args.session_lifetime,
+        conditional=args.conditional,
+        seed=1,
+    )
+    await server.async_start()
+
+    latencies: list[float] = []
+    failures = 0
+    tracemalloc.start()
+
+    try:
+        async with aiohttp.ClientSession(
+            cookie_jar=aiohttp.DummyCookieJar(),
+            trace_configs=[create_trace_config()],
+        ) as session:
+            api = AsyncTorchApi(session, server.username, server.password, server.url)
+            known_version = None
+
+            for _ in range(args.polls):
+                started = time.perf_counter()
+                try:
+                    if args.conditional:
+                        known_version, _ = await api.get_data_if_changed(known_version)
+                    else:
+                        await api.get_data()
+                except TorchApiError:
+                    failures += 1
+                latencies.append(time.perf_counter() - started)
+
+                if args.time_scale:
+                    await asyncio.sleep(args.interval / args.time_scale)
+
+            command_latencies, refresh_latencies = await async_switch(
+                api, args.commands
+            )
+
+            api.close()
+    finally:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await server.async_stop()
+
+    hours = args.polls * args.interval / 3600
+    latencies.sort()
+
+    return {
+        "polls": args.polls,
+        "failed_polls": failures,
+        "latency_p50_ms": statistics.median(latencies) * 1000,
+        "latency_p95_ms": _percentile(latencies, 0.95),
+        "latency_max_ms": latencies[-1] * 1000,
+        "commands": len(command_latencies),
+        "command_p50_ms": _percentile(command_latencies, 0.5),
+        "command_p95_ms": _percentile(command_latencies, 0.95),
+        "refresh_p50_ms": _percentile(refresh_latencies, 0.5),
+        "refresh_p95_ms": _percentile(refresh_latencies, 0.95),
+        "handshakes_per_hour": api.metrics.connections_created / hours,
+        "logins_per_hour": server.logins / hours,
+        "peak_traced_memory_kib": peak_memory / 1024,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+async def async_compare_sources(
+    args: argparse.Namespace,
+) -> dict[str, dict[str, float]]:
+    """Poll with each update source while the readings change.
+
+    The polls advance a clock by the interval each, and the burner
+    temperature changes at random times of that clock, on average every
+    change interval. A change is stale from when it happens until the first
+    poll returning it.
+    """
+
+    results = {}
+
+    for source in ("polling", "conditional"):
+        server = TorchStandInServer(
+            latency=args.latency,
+            error_rate=args.error_rate,
+            conditional=True,
+            seed=1,
+        )
+        await server.async_start()
+
+        changes = random.Random(1)
+        next_change = changes.expovariate(1 / args.change_interval)
+        changed_at: list[float] = []
+        staleness: list[float] = []
+        parsed_responses = 0
+
+        try:
+            async with aiohttp.ClientSession(
+                cookie_jar=aiohttp.DummyCookieJar()
+            ) as session:
+                api = AsyncTorchApi(
+                    session, server.username, server.password, server.url
+                )
+                known_version = None
+
+                for poll in range(args.polls):
+                    now = poll * args.interval
+
+                    while next_change <= now:
+                        changed_at.append(next_change)
+                        server.variables[PELLET_BURNER_TEMPERATURE_KEY] = str(
+                            100 + len(changed_at) + len(staleness)
+                        )
+                        next_change += changes.expovariate(1 / args.change_interval)
+
+                    try:
+                        if source == "conditional":
+                            known_version, data = await api.get_data_if_changed(
+                                known_version
+                            )
+                            parsed_responses += data is not None
+                        else:
+                            await api.get_data()
+                            parsed_responses += 1
+                    except TorchApiError:
+                        continue
+
+                    staleness.extend(now - timestamp for timestamp in changed_at)
+                    changed_at.clear()
+
+                api.close()
+        finally:
+            await server.async_stop()
+
+        results[source] = {
+            "requests": server.requests[GET_DATA_PATH],
+            "parsed_responses": parsed_responses,
+            "received_kib": api.metrics.endpoints[GET_DATA_PATH].received_bytes
+            / 1024,
+            "changes": len(staleness),
+            "staleness_mean_s": statistics.fmean(staleness) if staleness else 0.0,
+            "staleness_max_s": max(staleness, default=0.0),
+        }
+
+    return results
+
+
+def main() -> None:
+    """Run the benchmark with the command line arguments."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=500)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=60,
+        help="polling interval the polls stand for, in seconds",
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0,
+        help="how many times faster than the interval to poll, 0 for no waiting",
+    )
+    parser.add_argument(
+        "--commands",
+        type=int,
+        default=20,
+        help="burner commands sent after the polls",
+    )
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--session-lifetime", type=float, default=None)
+    parser.add_argument("--conditional", action="store_true")
+    parser.add_argument(
+        "--compare-sources",
+        action="store_true",
+        help="compare the polling and the conditional update sources",
+    )
+    parser.add_argument(
+        "--change-interval",
+        type=float,
+        default=300,
+        help="mean time between changes of the readings, in seconds",
+    )
+    args = parser.parse_args()
+
+    if not args.compare_sources:
+        for name, value in asyncio.run(async_benchmark(args)).items():
+            print(f"{name:>24}: {value:.1f}")
+        return
+
+    for source, results in asyncio.run(async_compare_sources(args)).items():
+        print(f"{source}:")
+        for name, value in results.items():
+            print(f"{name:>24}: {value:.1f}")
+
+
+if __name__ == "__main__":
+    main()
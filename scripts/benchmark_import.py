@@ -0,0 +1,107 @@
+"""Benchmark the import time of the Torch client module.
+
+Every run loads torch_api.py in a fresh interpreter, so nothing is cached
+between runs, and reports the median and fastest load time and the modules
+the load pulled in. aiohttp is imported first, as Home Assistant has loaded
+it long before any integration. A second revision of the module can be
+measured for comparison, such as the one before the blocking client was
+dropped. Run from the repository root:
+
+    python -m scripts.benchmark_import --runs 15 --before REV
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+
+MODULE_PATH = "custom_components/torch_pellet_system/torch_api.py"
+
+# Loads the module at the path given as the first argument and prints the
+# seconds it took and the number of modules it loaded
+_LOAD_MODULE = """
+import importlib.util
+import sys
+import time
+
+if sys.argv[2] == "preload":
+    import aiohttp
+
+loaded_modules = len(sys.modules)
+started = time.perf_counter()
+spec = importlib.util.spec_from_file_location("torch_api", sys.argv[1])
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+print(time.perf_counter() - started, len(sys.modules) - loaded_modules)
+"""
+
+
+def measure(path: Path, runs: int, preload: bool) -> dict[str, float]:
+    """Load the module in fresh interpreters and return the measurements."""
+
+    durations = []
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _LOAD_MODULE,
+                str(path),
+                "preload" if preload else "",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        durations.append(float(output[0]))
+
+    return {
+        "median_ms": statistics.median(durations) * 1000,
+        "min_ms": min(durations) * 1000,
+        "loaded_modules": int(output[1]),
+    }
+
+
+def main() -> None:
+    """Run the benchmark with the command line arguments."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument(
+        "--before",
+        help="git revision whose torch_api.py is measured for comparison",
+    )
+    parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="count the import of aiohttp in the load time",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {"working tree": Path(MODULE_PATH)}
+
+        if args.before:
+            paths[args.before] = Path(directory, "torch_api.py")
+            paths[args.before].write_bytes(
+                subprocess.run(
+                    ["git", "show", f"{args.before}:{MODULE_PATH}"],
+                    capture_output=True,
+                    check=True,
+                ).stdout
+            )
+
+        for name, path in paths.items():
+            results = measure(path, args.runs, not args.no_preload)
+            print(
+                f"{name:>16}: {results['median_ms']:.1f} ms median, "
+                f"{results['min_ms']:.1f} ms min, "
+                f"{results['loaded_modules']} modules loaded"
+            )
+
+
+if __name__ == "__main__":
+    main()
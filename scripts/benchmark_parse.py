@@ -0,0 +1,62 @@
+"""Benchmark the parsing of a recorded get_data response body.
+
+Compares parse_data_payload, with and without a key filter, with the
+original parser that decoded the whole body to a str and sliced it. Run from
+the repository root:
+
+    python -m scripts.benchmark_parse --number 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from custom_components.torch_pellet_system.const import SENSOR_DATA_KEYS
+from custom_components.torch_pellet_system.torch_api import parse_data_payload
+from tests.stand_in import load_payload
+
+
+def parse_decoded_body(body: bytes) -> dict[str, str]:
+    """Parse the body the way the client did before parsing bytes."""
+
+    content = body.decode("utf-8")
+    parsed_data = json.loads(content[content.index("{") : len(content)])
+
+    return {item["id"]: item["value"] for item in parsed_data["vars"]}
+
+
+def main() -> None:
+    """Time the parsers on the recorded payload."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--payload", default="get_data.txt")
+    args = parser.parse_args()
+
+    body = load_payload(args.payload)
+    parsers = {
+        "decoded body": lambda: parse_decoded_body(body),
+        "parse_data_payload": lambda: parse_data_payload(body),
+        "parse_data_payload(keys)": lambda: parse_data_payload(body, SENSOR_DATA_KEYS),
+    }
+
+    assert parse_decoded_body(body) == parse_data_payload(body)
+
+    print(f"payload: {len(body)} bytes")
+
+    for name, parse in parsers.items():
+        duration = min(timeit.repeat(parse, number=args.number, repeat=5))
+        tracemalloc.start()
+        parse()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(
+            f"{name:>26}: {duration / args.number * 1e6:.1f} us/parse, "
+            f"peak {peak_memory / 1024:.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests for the Torch Pellet System integration."""
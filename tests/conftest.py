@@ -0,0 +1,62 @@
+"""Fixtures for the Torch Pellet System tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from homeassistant import block_async_io
+from homeassistant.core import HomeAssistant
+
+from .stand_in import TorchStandInServer
+
+# Callbacks holding the event loop longer than this fail the blocking-call tests
+SLOW_CALLBACK_DURATION = 0.1
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+
+    yield
+
+
+@pytest.fixture
+async def torch_server() -> AsyncIterator[TorchStandInServer]:
+    """Run a stand-in for the Torch Web Interface."""
+
+    server = TorchStandInServer()
+    await server.async_start()
+
+    yield server
+
+    await server.async_stop()
+
+
+@pytest.fixture
+def fail_on_blocking_calls(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> Iterator[None]:
+    """Fail the test when the event loop is blocked.
+
+    Home Assistant's blocking-call detection reports blocking I/O made from
+    the loop, and asyncio's debug mode reports every callback that holds the
+    loop longer than SLOW_CALLBACK_DURATION.
+    """
+
+    block_async_io.enable()
+    hass.loop.set_debug(True)
+    hass.loop.slow_callback_duration = SLOW_CALLBACK_DURATION
+
+    yield
+
+    hass.loop.set_debug(False)
+
+    blocking_calls = [
+        record.getMessage()
+        for record in caplog.records
+        if "Detected blocking call" in record.getMessage()
+        or (record.name == "asyncio" and record.getMessage().startswith("Executing"))
+    ]
+
+    assert not blocking_calls
@@ -0,0 +1,241 @@
+"""Stand-in for the Torch Web Interface, serving the endpoints the client uses.
+
+The server emulates the session cookie, the login form, the get_data payload
+with its non-JSON prefix and the burner commands. Latency, failing responses
+and session expiry can be injected to exercise the client offline.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import hashlib
+import itertools
+import json
+from pathlib import Path
+import random
+import time
+
+from aiohttp import web
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+INVALID_CREDENTIALS_MESSAGE = "Потребителското име и паролата несъвпадат!"
+
+# The state the burner goes into after a command
+_COMMAND_STATES = {"on": "1", "off": "0"}
+
+
+def load_payload(name: str = "get_data.txt") -> bytes:
+    """Return a recorded get_data response body."""
+
+    return (FIXTURES / name).read_bytes()
+
+
+class TorchStandInServer:
+    """An aiohttp server standing in for the Torch Web Interface.
+
+    The variables of the payload are served back with the prefix of the
+    recorded body, and burner commands change the burner state the next
+    get_data returns.
+    """
+
+    def __init__(
+        self,
+        *,
+        username: str = "user",
+        password: str = "pass",
+        payload: bytes | None = None,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        session_lifetime: float | None = None,
+        conditional: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the server with the behaviour to emulate.
+
+        Every response is delayed by the latency, and the given share of them
+        fails with the error status. Sessions expire after their lifetime,
+        and with conditional set get_data answers 304 while the data is
+        unchanged.
+        """
+
+        payload = payload if payload is not None else load_payload()
+        json_start = payload.index(b"{")
+
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.session_lifetime = session_lifetime
+        self.conditional = conditional
+
+        self.prefix = payload[:json_start]
+        self.document = json.loads(payload[json_start:].decode("utf-8"))
+        self.variables: dict[str, str] = {
+            item["id"]: item["value"] for item in self.document["vars"]
+        }
+
+        self.requests: Counter[str] = Counter()
+        self.logins = 0
+        self.rejected_logins = 0
+        self.commands: list[str] = []
+
+        self._random = random.Random(seed)
+        self._failures_left = 0
+        self._session_ids = itertools.count()
+        self._sessions: dict[str, float] = {}
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    @property
+    def app(self) -> web.Application:
+        """Return the application serving the Torch endpoints."""
+
+        app = web.Application(middlewares=[self._inject_faults])
+        app.router.add_get("/user/", self._handle_user)
+        app.router.add_post("/", self._handle_login)
+        app.router.add_get("/user/ajax/get_data", self._handle_get_data)
+        app.router.add_post("/user/ajax/burner_onoff", self._handle_burner_onoff)
+
+        return app
+
+    async def async_start(self) -> str:
+        """Start serving on a free local port and return the base URL."""
+
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+
+        return self.url
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def fail_next(self, count: int = 1, status: int | None = None) -> None:
+        """Fail the next requests with the error status."""
+
+        self._failures_left = count
+        if status is not None:
+            self.error_status = status
+
+    def expire_sessions(self) -> None:
+        """Log out every session, as the Torch Web Interface does at times."""
+
+        self._sessions.clear()
+
+    def render_payload(self) -> bytes:
+        """Return the get_data body with the current variables."""
+
+        document = {
+            **self.document,
+            "vars": [
+                {**item, "value": self.variables[item["id"]]}
+                for item in self.document["vars"]
+            ],
+        }
+
+        return self.prefix + json.dumps(document, ensure_ascii=False).encode()
+
+    @web.middleware
+    async def _inject_faults(self, request: web.Request, handler) -> web.StreamResponse:
+        """Delay every response and fail the requested share of them."""
+
+        self.requests[request.path] += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self._failures_left or (
+            self.error_rate and self._random.random() < self.error_rate
+        ):
+            self._failures_left = max(self._failures_left - 1, 0)
+            return web.Response(status=self.error_status)
+
+        return await handler(request)
+
+    def _session_id(self, request: web.Request) -> str | None:
+        """Return the logged in session of a request."""
+
+        cookie = request.headers.get("Cookie", "")
+        session_id = cookie.partition("=")[2]
+
+        if (expires_at := self._sessions.get(session_id)) is None:
+            return None
+
+        if expires_at < time.monotonic():
+            del self._sessions[session_id]
+            return None
+
+        return session_id
+
+    async def _handle_user(self, request: web.Request) -> web.Response:
+        """Open a new session on the login page."""
+
+        response = web.Response(text="<html><form method='post'></form></html>")
+        response.headers["Set-Cookie"] = (
+            f"PHPSESSID=standin{next(self._session_ids)}; path=/"
+        )
+
+        return response
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        """Log a session in."""
+
+        form = await request.post()
+        session_id = request.headers.get("Cookie", "").partition("=")[2]
+
+        if (form.get("username"), form.get("password")) != (
+            self.username,
+            self.password,
+        ):
+            self.rejected_logins += 1
+            return web.Response(text=f"<html>{INVALID_CREDENTIALS_MESSAGE}</html>")
+
+        self.logins += 1
+        self._sessions[session_id] = time.monotonic() + (
+            self.session_lifetime if self.session_lifetime is not None else 1e9
+        )
+
+        return web.Response(text="<html>Dashboard</html>")
+
+    async def _handle_get_data(self, request: web.Request) -> web.Response:
+        """Serve the variables to a logged in session."""
+
+        if self._session_id(request) is None:
+            raise web.HTTPFound("/user/")
+
+        body = self.render_payload()
+        headers = {}
+
+        if self.conditional:
+            etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            headers["ETag"] = etag
+
+        return web.Response(body=body, content_type="text/html", headers=headers)
+
+    async def _handle_burner_onoff(self, request: web.Request) -> web.Response:
+        """Switch the burner of a logged in session."""
+
+        if self._session_id(request) is None:
+            raise web.HTTPFound("/user/")
+
+        form = await request.post()
+        command = str(form.get("goto"))
+        self.commands.append(command)
+
+        if (state := _COMMAND_STATES.get(command)) is not None:
+            self.variables["bd_state"] = state
+
+        return web.Response(text="")
@@ -0,0 +1,54 @@
+"""Tests for the fault detection of the Torch Pellet System."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.torch_pellet_system.anomalies import TorchAnomalyDetector
+from custom_components.torch_pellet_system.const import BURNER_OVERHEATING_KEY
+from custom_components.torch_pellet_system.models import TorchPelletSystemSnapshot
+
+
+def _snapshot(seconds: float) -> TorchPelletSystemSnapshot:
+    """Return a burning snapshot published with the same burner temperature."""
+
+    return TorchPelletSystemSnapshot.from_data(
+        {"bd_state": "3", "bd_t_body": "150"},
+        datetime(2026, 1, 1, 10, tzinfo=timezone.utc) + timedelta(seconds=seconds),
+    )
+
+
+def test_burner_overheating_uses_raw_temperature() -> None:
+    """Test that the rate of rise is taken from the raw readings.
+
+    The published temperature stays put within the deadband, which must not
+    hide a rise faster than the limit.
+    """
+
+    detector = TorchAnomalyDetector()
+
+    assert detector.update(_snapshot(0), 150.0) == set()
+    assert detector.update(_snapshot(30), 154.0) == set()
+    assert detector.update(_snapshot(60), 160.0) == {BURNER_OVERHEATING_KEY}
+    assert detector.active[BURNER_OVERHEATING_KEY]
+
+    # A missing reading keeps the state, and the next one is compared with
+    # the last reading
+    assert detector.update(_snapshot(90), None) == set()
+    assert detector.update(_snapshot(120), 200.0) == set()
+    assert detector.update(_snapshot(180), 201.0) == {BURNER_OVERHEATING_KEY}
+    assert not detector.active[BURNER_OVERHEATING_KEY]
+
+
+def test_burner_overheating_across_command_refresh() -> None:
+    """Test that a refresh without the burner temperature is not a reading.
+
+    The refresh confirming a command only reads the burner state, so the
+    rise up to the next poll is spread over the time since the last poll.
+    """
+
+    detector = TorchAnomalyDetector()
+
+    assert detector.update(_snapshot(0), 100.0) == set()
+    assert detector.update(_snapshot(40), None) == set()
+    assert detector.update(_snapshot(55), 108.0) == set()
+    assert not detector.active[BURNER_OVERHEATING_KEY]
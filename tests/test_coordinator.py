@@ -0,0 +1,56 @@
+"""Tests for the data update coordinator of the Torch Pellet System."""
+from __future__ import annotations
+
+from custom_components.torch_pellet_system.const import CONF_TEMPERATURE_DEADBAND
+from custom_components.torch_pellet_system.coordinator import TorchChangeFilter
+
+
+def test_change_filter_without_deadband() -> None:
+    """Test that every changed value is published."""
+
+    change_filter = TorchChangeFilter({})
+
+    assert change_filter.update({"bd_t_curr": "60.0", "bd_state": "3"}) == {
+        "bd_t_curr",
+        "bd_state",
+    }
+    assert change_filter.update({"bd_t_curr": "60.1", "bd_state": "3"}) == {
+        "bd_t_curr"
+    }
+    assert change_filter.values == {"bd_t_curr": "60.1", "bd_state": "3"}
+
+
+def test_change_filter_deadband() -> None:
+    """Test that temperatures moving less than the deadband are held back."""
+
+    change_filter = TorchChangeFilter({CONF_TEMPERATURE_DEADBAND: 0.5})
+
+    assert change_filter.update({"bd_t_curr": "60.0", "bd_lux": "80"}) == {
+        "bd_t_curr",
+        "bd_lux",
+    }
+
+    # Jitter of a temperature is held back, but not of other variables
+    assert change_filter.update({"bd_t_curr": "60.4", "bd_lux": "81"}) == {"bd_lux"}
+    assert change_filter.values["bd_t_curr"] == "60.0"
+
+    # The deadband is measured from the published value
+    assert change_filter.update({"bd_t_curr": "59.5"}) == {"bd_t_curr"}
+    assert change_filter.values["bd_t_curr"] == "59.5"
+
+
+def test_change_filter_deadband_with_invalid_readings() -> None:
+    """Test that readings that are not numbers always get published."""
+
+    change_filter = TorchChangeFilter({CONF_TEMPERATURE_DEADBAND: 0.5})
+    change_filter.update({"bd_t_body": "150.0", "bd_t_back": "55.0"})
+
+    assert change_filter.update({"bd_t_body": None, "bd_t_back": [55.2]}) == {
+        "bd_t_body",
+        "bd_t_back",
+    }
+    assert change_filter.update({"bd_t_body": "150.2", "bd_t_back": "--"}) == {
+        "bd_t_body",
+        "bd_t_back",
+    }
+    assert change_filter.values == {"bd_t_body": "150.2", "bd_t_back": "--"}
@@ -0,0 +1,33 @@
+"""Tests for the telemetry export of the Torch Pellet System."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from custom_components.torch_pellet_system.exporter import decode_line, encode_line
+
+TIMESTAMP = datetime(2026, 1, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+def test_encode_line() -> None:
+    """Test that every scalar value is encoded and the rest left out."""
+
+    line = encode_line(
+        "entry 1",
+        TIMESTAMP,
+        {"bd_t_body": "148.6", "bd_lux": 87, "bd_prog": 'Зима "2"', "bd_err": None},
+    )
+
+    assert line == (
+        'torch_pellet_system,entry=entry\\ 1 bd_lux=87,bd_prog="Зима \\"2\\"",'
+        "bd_t_body=148.6 1767261600123456000\n"
+    )
+    assert decode_line(line) == (
+        TIMESTAMP,
+        {"bd_lux": "87", "bd_prog": 'Зима "2"', "bd_t_body": "148.6"},
+    )
+
+
+def test_encode_line_without_scalars() -> None:
+    """Test that a poll without any scalar value has no line."""
+
+    assert encode_line("entry", TIMESTAMP, {"bd_err": None, "bd_log": [1, 2]}) is None
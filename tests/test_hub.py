@@ -0,0 +1,56 @@
+"""Tests for the hub sharing logins between Torch Pellet System entries."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.torch_pellet_system.const import (
+    DOMAIN,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from custom_components.torch_pellet_system.hub import (
+    _credentials_fingerprint,
+    async_get_hub,
+)
+
+
+@pytest.mark.parametrize(
+    ("password", "session_cookie"),
+    [("pass", "PHPSESSID=stored"), ("wrong", "")],
+)
+async def test_restore_session_of_same_credentials(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    password: str,
+    session_cookie: str,
+) -> None:
+    """Test that a persisted session is only reused with its credentials."""
+
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            "sessions": {
+                "user": {
+                    "session_cookie": "PHPSESSID=stored",
+                    "expires_at": time.time() + 3600,
+                    "credentials": _credentials_fingerprint("user", "pass"),
+                }
+            }
+        },
+    }
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"username": "user", "password": password}
+    )
+
+    api = await async_get_hub(hass).async_get_api(entry)
+
+    assert api.session_manager.session_cookie == session_cookie
+
+    await async_get_hub(hass).async_release_api(entry)
@@ -0,0 +1,71 @@
+"""Tests for setting up the Torch Pellet System integration."""
+from __future__ import annotations
+
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.torch_pellet_system.const import DOMAIN
+from custom_components.torch_pellet_system.coordinator import (
+    TorchBurnerCommandPipeline,
+)
+from custom_components.torch_pellet_system.torch_api import AsyncTorchApi
+
+from .stand_in import TorchStandInServer
+
+
+@pytest.mark.usefixtures("recorder_mock", "fail_on_blocking_calls")
+async def test_setup_does_not_block(
+    hass: HomeAssistant, torch_server: TorchStandInServer
+) -> None:
+    """Test that setting up, polling and switching never block the loop."""
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Torch",
+        data={"username": torch_server.username, "password": torch_server.password},
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.torch_pellet_system.hub.AsyncTorchApi",
+        partial(AsyncTorchApi, base_url=torch_server.url),
+    ), patch.object(TorchBurnerCommandPipeline, "COALESCE_DELAY", 0):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert entry.state is ConfigEntryState.LOADED
+        assert torch_server.logins == 1
+
+        entity_id = er.async_get(hass).async_get_entity_id(
+            SWITCH_DOMAIN, DOMAIN, f"{entry.entry_id}_enabled"
+        )
+        assert hass.states.get(entity_id).state == STATE_ON
+
+        await hass.data[DOMAIN][entry.entry_id].async_refresh()
+        await hass.services.async_call(
+            SWITCH_DOMAIN,
+            SERVICE_TURN_OFF,
+            {ATTR_ENTITY_ID: entity_id},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+        assert torch_server.commands == ["off"]
+        assert hass.states.get(entity_id).state == STATE_OFF
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,92 @@
+"""Tests for the hourly long-term statistics of the Torch Pellet System."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.torch_pellet_system.const import (
+    DOMAIN,
+    STATISTICS_STORAGE_KEY,
+)
+from custom_components.torch_pellet_system.long_term_statistics import (
+    TorchLongTermStatistics,
+    async_remove_statistics_state,
+)
+from custom_components.torch_pellet_system.models import TorchPelletSystemSnapshot
+
+INTERVAL = timedelta(seconds=60)
+
+
+def _snapshot(minutes: float, burned_pellets: float) -> TorchPelletSystemSnapshot:
+    """Return a burning snapshot taken the given minutes after 10:00."""
+
+    return TorchPelletSystemSnapshot.from_data(
+        {"bd_state": "3", "bd_pell": str(burned_pellets)},
+        datetime(2026, 1, 1, 10, tzinfo=timezone.utc) + timedelta(minutes=minutes),
+    )
+
+
+@pytest.mark.parametrize(
+    ("polls", "pellets", "burn_hours"),
+    [
+        # Polled every minute through the 10:00 hour
+        ([(minutes, 100 + minutes / 6) for minutes in range(61)], [10.0], [1.0]),
+        # Three hours without a poll after 10:00
+        ([(0, 100), (180, 130)], [10.0, 10.0, 10.0], [0.017, 0.0, 0.0]),
+    ],
+)
+async def test_hourly_totals(
+    hass: HomeAssistant,
+    polls: list[tuple[float, float]],
+    pellets: list[float],
+    burn_hours: list[float],
+) -> None:
+    """Test that burning time is not counted across a gap in the polling.
+
+    The pellets burned during a gap are still spread over the hours it spans.
+    """
+
+    entry = MockConfigEntry(domain=DOMAIN, title="Torch")
+    statistics = TorchLongTermStatistics(hass, entry)
+
+    with patch(
+        "custom_components.torch_pellet_system.long_term_statistics"
+        ".async_add_external_statistics"
+    ) as add_statistics:
+        for minutes, burned_pellets in polls:
+            statistics.update(_snapshot(minutes, burned_pellets), INTERVAL)
+
+    consumption, hours = (call.args[2] for call in add_statistics.call_args_list)
+
+    assert [statistic["state"] for statistic in consumption] == pellets
+    assert [statistic["state"] for statistic in hours] == burn_hours
+
+
+async def test_removed_state_is_not_written_again(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that no delayed write brings back the state of a removed entry."""
+
+    entry = MockConfigEntry(domain=DOMAIN, title="Torch")
+    statistics = TorchLongTermStatistics(hass, entry)
+    storage_key = f"{STATISTICS_STORAGE_KEY}.{entry.entry_id}"
+
+    statistics.update(_snapshot(0, 100), INTERVAL)
+    await statistics.async_shutdown()
+    assert hass_storage[storage_key]["data"]["last_burned_pellets"] == 100
+
+    await async_remove_statistics_state(hass, entry.entry_id)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=5))
+    await hass.async_block_till_done()
+
+    assert storage_key not in hass_storage
@@ -0,0 +1,91 @@
+"""Tests for the decoding of the Torch Pellet System readings."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.torch_pellet_system.models import (
+    PelletSystemState,
+    TorchNetControlStatus,
+    TorchPelletSystemSnapshot,
+)
+
+TIMESTAMP = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("state_code", "pellet_system_state", "is_burner_on"),
+    [
+        ("0", PelletSystemState.TURNED_OFF, False),
+        ("1", PelletSystemState.STARTING, True),
+        ("3", PelletSystemState.BURNING, True),
+        ("4", PelletSystemState.COOLING_DOWN, False),
+        ("5", PelletSystemState.COOLING_DOWN, True),
+        ("6", PelletSystemState.WAITING, True),
+        ("9", PelletSystemState.UNKNOWN, True),
+        (None, PelletSystemState.UNKNOWN, False),
+    ],
+)
+def test_pellet_system_state(
+    state_code: str | None,
+    pellet_system_state: PelletSystemState,
+    is_burner_on: bool,
+) -> None:
+    """Test the burner state and switch state of every bd_state code."""
+
+    data = {} if state_code is None else {"bd_state": state_code}
+    snapshot = TorchPelletSystemSnapshot.from_data(data, TIMESTAMP)
+
+    assert snapshot.pellet_system_state_code == state_code
+    assert snapshot.pellet_system_state is pellet_system_state
+    assert snapshot.is_burner_on is is_burner_on
+
+
+@pytest.mark.parametrize(
+    ("link_status", "tnc_status"),
+    [
+        ("0", TorchNetControlStatus.OFFLINE),
+        ("1", TorchNetControlStatus.ONLINE),
+        ("2", TorchNetControlStatus.UNKNOWN),
+        (None, TorchNetControlStatus.UNKNOWN),
+    ],
+)
+def test_tnc_status(
+    link_status: str | None, tnc_status: TorchNetControlStatus
+) -> None:
+    """Test the link status of every link_status code."""
+
+    data = {} if link_status is None else {"link_status": link_status}
+
+    assert TorchPelletSystemSnapshot.from_data(data, TIMESTAMP).tnc_status is tnc_status
+
+
+def test_numeric_readings() -> None:
+    """Test that numbers are decoded and invalid readings become None."""
+
+    snapshot = TorchPelletSystemSnapshot.from_data(
+        {"bd_t_curr": "61.4", "bd_t_back": "--", "bd_pell": "1284.37", "bd_o2": "7"},
+        TIMESTAMP,
+        ("bd_o2", "bd_fan"),
+    )
+
+    assert snapshot.water_temperature_out == 61.4
+    assert snapshot.water_temperature_in is None
+    assert snapshot.burner_temperature is None
+    assert snapshot.burned_pellets == 1284.37
+    assert snapshot.readings == {"bd_o2": 7.0, "bd_fan": None}
+
+
+def test_non_scalar_values() -> None:
+    """Test that values of the wrong type are decoded as missing."""
+
+    snapshot = TorchPelletSystemSnapshot.from_data(
+        {"bd_state": ["3"], "link_status": {"value": "1"}, "bd_t_body": [148.6]},
+        TIMESTAMP,
+    )
+
+    assert snapshot.pellet_system_state is PelletSystemState.UNKNOWN
+    assert not snapshot.is_burner_on
+    assert snapshot.tnc_status is TorchNetControlStatus.UNKNOWN
+    assert snapshot.burner_temperature is None